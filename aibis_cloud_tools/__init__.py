@@ -4,18 +4,30 @@ Aivis Cloud TTS ライブラリ
 共通のTTS機能とユーティリティ関数を提供します。
 """
 
-from .tts import AivisCloudTTS
+from .cache import AudioCache, synthesis_key
 from .utils import (
     load_env_file,
     split_text_smart,
+    iter_text_file_chunks,
     get_default_model,
     clean_markdown_for_tts
 )
 
 __all__ = [
     'AivisCloudTTS',
+    'AudioCache',
+    'synthesis_key',
     'load_env_file',
     'split_text_smart', 
+    'iter_text_file_chunks',
     'get_default_model',
     'clean_markdown_for_tts'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # requestsの読み込みを実際に使われるまで遅らせる（CLIの--help等の起動を軽くする）
+    if name == 'AivisCloudTTS':
+        from .tts import AivisCloudTTS
+        return AivisCloudTTS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+合成済み音声のLRUキャッシュ
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "aibis-tts"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256MB
+
+
+class AudioCache:
+    """合成パラメータをキーに音声データをディスクへ保存するLRUキャッシュ"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        キャッシュを初期化
+
+        Args:
+            cache_dir: キャッシュディレクトリ（デフォルト: ~/.cache/aibis-tts）
+            max_bytes: キャッシュ全体の上限サイズ（バイト）
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR).expanduser()
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # キー -> ファイルサイズ（古い順）
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._load_existing_entries()
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """合成パラメータからキャッシュキー（SHA-256）を生成"""
+        return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.audio"
+
+    def _load_existing_entries(self):
+        """既存のキャッシュファイルを最終アクセス順に登録"""
+        if not self.cache_dir.is_dir():
+            return
+        try:
+            files = sorted(self.cache_dir.glob("*.audio"), key=lambda p: p.stat().st_mtime)
+        except OSError:
+            return
+        for path in files:
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            self._entries[path.stem] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _evict(self):
+        """上限を超えた分を古い順に削除（ロック取得済みで呼び出す）"""
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                os.unlink(self._path_for(key))
+            except OSError:
+                pass
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        キャッシュから音声データを取得
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            音声データ（存在しない場合はNone）
+        """
+        with self._lock:
+            if key not in self._entries:
+                return None
+            path = self._path_for(key)
+            try:
+                data = path.read_bytes()
+                os.utime(path)  # 再起動後もLRU順を保つ
+            except OSError:
+                self._total_bytes -= self._entries.pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return data
+
+    def put(self, key: str, data: bytes):
+        """
+        音声データをキャッシュに保存
+
+        Args:
+            key: キャッシュキー
+            data: 音声データ
+        """
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            temp_path = None
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                # 書き込み途中のファイルを読まれないよう一時ファイル経由で置き換える
+                fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, self._path_for(key))
+            except OSError:
+                # 容量不足などで失敗した一時ファイルは管理対象外で削除されないため、ここで消す
+                if temp_path is not None:
+                    try:
+                        os.unlink(temp_path)
+                    except OSError:
+                        pass
+                return
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)
+            self._entries[key] = len(data)
+            self._total_bytes += len(data)
+            self._evict()
+
+    def get_or_synthesize(self, key: str, synthesize: Callable[[], bytes]) -> bytes:
+        """
+        キャッシュにあれば返し、なければ合成して保存
+
+        Args:
+            key: キャッシュキー
+            synthesize: 音声データを返す合成関数
+
+        Returns:
+            音声データ
+        """
+        data = self.get(key)
+        if data is None:
+            data = synthesize()
+            self.put(key, data)
+        return data
+
+
+def synthesis_key(
+    text: str,
+    model_uuid: str,
+    *,
+    speaker_uuid: Optional[str] = None,
+    style_name: Optional[str] = None,
+    output_format: str = "mp3",
+    speaking_rate: float = 1.0,
+    emotional_intensity: float = 1.0,
+    volume: float = 1.0
+) -> str:
+    """
+    音声合成リクエストのキャッシュキーを生成
+
+    引数とデフォルト値はAivisCloudTTS.synthesize_speech()と同じで、
+    同じリクエストであれば呼び出し元によらず同じキーになる
+
+    Returns:
+        キャッシュキー（SHA-256）
+    """
+    # 1と1.0のような数値の表記揺れで別のキーにならないようfloatに揃える
+    return AudioCache.make_key(
+        text, model_uuid, speaker_uuid, style_name, output_format,
+        float(speaking_rate), float(emotional_intensity), float(volume)
+    )
@@ -3,13 +3,50 @@
 Aivis Cloud TTS クライアントライブラリ
 """
 
+import io
 import json
 import os
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 from typing import Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache import DEFAULT_CACHE_DIR
+
+try:
+    import orjson
+except ImportError:  # オプション依存（fast extra）
+    orjson = None
+
+# JSONエラーレスポンスのパーサー（orjsonがあれば使用）
+_json_loads = orjson.loads if orjson else json.loads
+
+
+def _json_dumps(payload: dict) -> bytes:
+    """リクエスト本文をUTF-8のコンパクトなJSONにシリアライズ（orjsonがあれば使用）"""
+    if orjson:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# 標準入力から音声を読み込めるプレイヤー（優先順）: (コマンド, 対応形式（Noneは全形式）)
+STDIN_PLAYERS = [
+    (["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", "-i", "-"], None),
+    (["mpg123", "-q", "-"], {"mp3"}),
+]
+
+# 一括受信時の読み込み単位（呼び出し回数を減らすため大きめに取る）
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# 再生しながら受信する場合の読み込み単位（urllib3はこのサイズが揃うまで返さないため、
+# 大きくすると最初の音声が出るまでの待ち時間が延びる）
+STREAM_CHUNK_SIZE = 16 * 1024
 
 
 class AivisCloudTTS:
@@ -29,22 +66,58 @@ class AivisCloudTTS:
             "Content-Type": "application/json"
         }
 
-    def list_models(self, limit: int = 10) -> dict:
+        # チャンク間でTCP/TLS接続を再利用するためのセッション
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # 再試行はurllib3の既定どおり冪等なメソッドのみ（合成のPOSTは二重課金を避けるため対象外）
+        retries = Retry(
+            total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False
+        )
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+
+    def close(self):
+        """HTTPセッションを閉じる"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def list_models(self, limit: int = 10, cache_ttl: float = 0) -> dict:
         """
         利用可能な音声合成モデルを取得
 
         Args:
             limit: 取得するモデル数
+            cache_ttl: 検索結果をディスクにキャッシュする秒数（0の場合はキャッシュしない）
 
         Returns:
             モデル検索結果
         """
         url = f"{self.base_url}/aivm-models/search"
         params = {"limit": limit, "sort": "download"}
+        cache_path = DEFAULT_CACHE_DIR / f"models-{params['sort']}-{limit}.json"
+
+        if cache_ttl > 0:
+            try:
+                if time.time() - cache_path.stat().st_mtime < cache_ttl:
+                    return json.loads(cache_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                pass  # キャッシュがない・壊れている場合はAPIから取得
 
-        response = requests.get(url, params=params)
+        response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        models = response.json()
+
+        if cache_ttl > 0:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(json.dumps(models, ensure_ascii=False), encoding="utf-8")
+            except OSError:
+                pass
+        return models
 
     def synthesize_speech(
         self,
@@ -73,8 +146,6 @@ class AivisCloudTTS:
         Returns:
             合成された音声データ
         """
-        url = f"{self.base_url}/tts/synthesize"
-
         payload = {
             "model_uuid": model_uuid,
             "use_ssml": True,
@@ -89,30 +160,41 @@ class AivisCloudTTS:
         if style_name:
             payload["style_name"] = style_name
 
-        response = requests.post(url, headers=self.headers, json=payload, stream=True)
+        response = self._post_synthesis(payload)
+        return self._read_audio(response)
+
+    def _post_synthesis(self, payload: dict):
+        """合成リクエストを送信し、HTTPエラーを例外にする（本文は未読のストリーミングレスポンスを返す）"""
+        # 音声は圧縮済みのため転送時の圧縮は要求しない（urllib3のデコーダーも通らない）
+        response = self.session.post(
+            f"{self.base_url}/tts/synthesize",
+            data=_json_dumps(payload),
+            headers={"Accept-Encoding": "identity"},
+            stream=True
+        )
         
         # 詳細なHTTPエラーハンドリング
         if response.status_code != 200:
             self._handle_http_error(response)
             response.raise_for_status()  # 例外を発生させる
+        return response
 
-        # レスポンスヘッダーを確認（デバッグ用）
+    def _read_audio(self, response) -> bytes:
+        """レスポンス本文を音声データとして読み込み、JSONエラーなら例外を発生させる"""
         content_type = response.headers.get('Content-Type', 'unknown')
         
-        # ストリーミングレスポンスを読み込み
-        audio_data = b""
-        for chunk in response.iter_content(chunk_size=8192):
-            if chunk:
-                audio_data += chunk
+        response.raw.decode_content = True
+        if response.headers.get('Content-Length'):
+            # 長さが分かっている場合はその大きさで一度に読み込む（途中の再確保なし）
+            audio_data = response.raw.read()
+        else:
+            # レスポンス全体を一括で読み込み（Pythonのチャンクループを介さずにコピー）
+            buffer = io.BytesIO()
+            shutil.copyfileobj(response.raw, buffer, DOWNLOAD_CHUNK_SIZE)
+            audio_data = buffer.getvalue()
 
         # JSON エラーレスポンスかチェック
-        if audio_data.startswith(b'{'):
-            try:
-                error_data = json.loads(audio_data.decode('utf-8'))
-                if 'status_code' in error_data and 'detail' in error_data:
-                    raise Exception(f"API Error: {error_data['status_code']} - {error_data['detail']}")
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                pass  # JSON でない場合は通常の音声データとして処理
+        self._check_json_error(audio_data, content_type)
 
         return audio_data
 
@@ -128,7 +210,8 @@ class AivisCloudTTS:
         volume: float = 1.0,
         save_file: Optional[str] = None,
         enable_realtime_play: bool = True,
-        no_wait: bool = False
+        no_wait: bool = False,
+        return_audio: bool = True
     ) -> bytes:
         """
         テキストから音声を合成し、リアルタイム再生
@@ -145,12 +228,11 @@ class AivisCloudTTS:
             save_file: 保存先ファイルパス
             enable_realtime_play: リアルタイム再生を有効にするか
             no_wait: 音声再生の終了を待たない
+            return_audio: Falseの場合、リアルタイム再生中・ファイル保存時は受信データをメモリに保持しない
 
         Returns:
-            合成された音声データ
+            合成された音声データ（return_audio=Falseでリアルタイム再生・ファイル保存した場合は空）
         """
-        url = f"{self.base_url}/tts/synthesize"
-
         payload = {
             "model_uuid": model_uuid,
             "use_ssml": True,
@@ -167,23 +249,31 @@ class AivisCloudTTS:
         if style_name:
             payload["style_name"] = style_name
 
-        response = requests.post(url, headers=self.headers, json=payload, stream=True)
-        
-        # 詳細なHTTPエラーハンドリング
-        if response.status_code != 200:
-            self._handle_http_error(response)
-            response.raise_for_status()  # 例外を発生させる
+        response = self._post_synthesis(payload)
 
         # レスポンスヘッダーを確認
         content_type = response.headers.get('Content-Type', 'unknown')
 
         # リアルタイム再生用の準備
-        audio_data = b""
+        buffer = bytearray()
         audio_player = None
         temp_file_path = None
         
-        if enable_realtime_play and output_format == "mp3" and sys.platform == "darwin":
-            # macOSでMP3のリアルタイム再生を試行
+        player_command = self._find_stdin_player(output_format) if enable_realtime_play else None
+        if player_command and not content_type.startswith('application/json'):
+            # 標準入力から読めるプレイヤーには受信データをそのまま流す（一時ファイル・先読み待ち不要）
+            try:
+                audio_player = subprocess.Popen(
+                    player_command,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+            except OSError:
+                audio_player = None
+        elif enable_realtime_play and output_format == "mp3" and sys.platform == "darwin" \
+                and not content_type.startswith('application/json'):
+            # afplayは標準入力に非対応のため、一時ファイル経由でリアルタイム再生を試行
             try:
                 file_extension = "mp3"
                 temp_file = tempfile.NamedTemporaryFile(suffix=f".{file_extension}", delete=False)
@@ -193,88 +283,118 @@ class AivisCloudTTS:
                 enable_realtime_play = False
                 temp_file_path = None
 
-        # ストリーミング受信と書き込み
+        # 受信・再生中のエラーや中断でも、プレイヤーの停止と一時ファイルの削除を必ず行う
+        try:
+            # ストリーミング受信と書き込み
+            received_bytes = 0
         
-        if enable_realtime_play and temp_file_path:
-            # リアルタイム再生用の書き込み
-            # 32KBバッファリング改善：十分なデータが蓄積されてからafplayを開始
-            MIN_BUFFER_SIZE = 32 * 1024  # 32KB - MP3ヘッダー + 音声データの完整性を確保
-            
-            with open(temp_file_path, "wb") as f:
-                chunk_count = 0
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        audio_data += chunk
-                        f.write(chunk)
-                        f.flush()  # 即座にディスクに書き込み
-                        chunk_count += 1
-                        
-                        # 32KB以上のデータが蓄積されたらafplayを開始
-                        if len(audio_data) >= MIN_BUFFER_SIZE and not audio_player:
-                            try:
-                                audio_player = subprocess.Popen(
-                                    ["afplay", temp_file_path],
-                                    stdout=subprocess.PIPE,
-                                    stderr=subprocess.PIPE
-                                )
-                            except Exception as e:
-                                # afplayの開始に失敗した場合はリアルタイム再生を無効化
-                                enable_realtime_play = False
-        else:
-            # 通常の書き込み
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    audio_data += chunk
-                    if save_file:
-                        # 保存ファイルがある場合は後で書き込み
+            if audio_player:
+                # パイプ再生用の書き込み
+                player_stdin = audio_player.stdin
+                try:
+                    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                        if chunk:
+                            received_bytes += len(chunk)
+                            if return_audio or not buffer:  # 保持しない場合もJSONエラー判定用に先頭は残す
+                                buffer.extend(chunk)
+                            if player_stdin:
+                                try:
+                                    player_stdin.write(chunk)
+                                except BrokenPipeError:
+                                    # プレイヤーが先に終了した場合は受信のみ続ける
+                                    player_stdin = None
+                finally:
+                    try:
+                        audio_player.stdin.close()  # EOFを通知
+                    except OSError:
                         pass
+            elif enable_realtime_play and temp_file_path:
+                # リアルタイム再生用の書き込み
+                # 32KBバッファリング改善：十分なデータが蓄積されてからafplayを開始
+                MIN_BUFFER_SIZE = 32 * 1024  # 32KB - MP3ヘッダー + 音声データの完整性を確保
+
+                raw = response.raw
+                raw.decode_content = True
+                with open(temp_file_path, "wb") as f:
+                    # 先頭32KB（短い音声なら全体）を書き込んでからafplayを開始
+                    head = raw.read(MIN_BUFFER_SIZE)
+                    f.write(head)
+                    f.flush()
+                    buffer.extend(head)  # JSONエラー判定用
+                    if len(head) >= MIN_BUFFER_SIZE:
+                        try:
+                            audio_player = subprocess.Popen(
+                                ["afplay", temp_file_path],
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL
+                            )
+                        except Exception as e:
+                            # afplayの開始に失敗した場合はリアルタイム再生を無効化
+                            enable_realtime_play = False
+                    # 残りはC実装のコピーでファイルへ流す（チャンク単位のPython処理を省く）
+                    shutil.copyfileobj(raw, f, STREAM_CHUNK_SIZE)
+                    received_bytes = f.tell()
+                if return_audio and received_bytes > len(buffer):
+                    # 受信データは一時ファイルから読み戻す
+                    with open(temp_file_path, "rb") as f:
+                        buffer = bytearray(f.read())
+            else:
+                # 再生しない場合はsynthesize_speechと同じく一括で読み込む
+                buffer = None
+
+            if buffer is None and save_file and not return_audio and not enable_realtime_play \
+                    and content_type.startswith('audio/'):
+                # 保存のみの場合はメモリに溜めずにファイルへ直接書き込む
+                response.raw.decode_content = True
+                with open(save_file, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
+                return b""
+
+            if buffer is None:
+                audio_data = self._read_audio(response)
+                received_bytes = len(audio_data)
+            else:
+                audio_data = bytes(buffer)
+                # JSON エラーレスポンスかチェック
+                self._check_json_error(audio_data, content_type)
+                if not return_audio:
+                    audio_data = b""
 
-        # JSON エラーレスポンスかチェック
-        if audio_data.startswith(b'{'):
-            try:
-                error_data = json.loads(audio_data.decode('utf-8'))
-                if 'status_code' in error_data and 'detail' in error_data:
-                    raise Exception(f"API Error: {error_data['status_code']} - {error_data['detail']}")
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                pass
-
-        # データ受信完了
+            # データ受信完了
 
-        # リアルタイム再生の終了を待つ
-        if audio_player:
-            if no_wait:
-                # バックグラウンド再生の場合は一時ファイルを残す（注意：手動削除が必要）
-                pass
-            else:
-                # 音声の長さを推定（MP3の場合、おおよその計算）
-                # 128kbps MP3の場合: 1秒 ≈ 16KB、安全のため余裕をもたせる
-                estimated_duration = max(30, (len(audio_data) / 16000) * 1.5 + 10)  # 最低30秒、余裕をもって1.5倍+10秒
-                
+            # 先読み分に届かない短い音声は、受信完了後のファイルで再生を開始
+            if temp_file_path and not audio_player and enable_realtime_play and received_bytes:
+                try:
+                    audio_player = subprocess.Popen(
+                        ["afplay", temp_file_path],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL
+                    )
+                except Exception:
+                    audio_player = None
+
+            # リアルタイム再生の終了を待つ
+            if audio_player and not no_wait:
+                # パイプはEOF通知済み、一時ファイルは書き込み済みなので、再生が終われば自然に終了する
+                audio_player.wait()
+        except BaseException:
+            # 書きかけのファイルやパイプを再生し続けないよう停止する
+            if audio_player:
+                audio_player.terminate()
                 try:
-                    return_code = audio_player.wait(timeout=estimated_duration)
+                    audio_player.wait(timeout=2)
                 except subprocess.TimeoutExpired:
-                    audio_player.terminate()
-                    try:
-                        audio_player.wait(timeout=5)  # 強制終了の完了を5秒待機
-                    except subprocess.TimeoutExpired:
-                        audio_player.kill()  # さらに強制終了
-                except KeyboardInterrupt:
-                    audio_player.terminate()
-                    try:
-                        audio_player.wait(timeout=2)
-                    except subprocess.TimeoutExpired:
-                        audio_player.kill()
-                    raise
-                except Exception as e:
-                    # リアルタイム再生の終了処理でエラーが発生した場合
-                    pass
-                finally:
-                    # 一時ファイル削除
-                    if temp_file_path and os.path.exists(temp_file_path):
-                        try:
-                            os.unlink(temp_file_path)
-                        except OSError:
-                            pass
+                    audio_player.kill()
+            raise
+        finally:
+            if temp_file_path:
+                if audio_player and no_wait:
+                    # バックグラウンド再生は終了を見届けてから一時ファイルを削除
+                    threading.Thread(
+                        target=self._remove_after_exit, args=(audio_player, temp_file_path), daemon=True
+                    ).start()
+                else:
+                    self._remove_file(temp_file_path)
 
         # 通常の保存処理
         if save_file and not enable_realtime_play:
@@ -283,6 +403,141 @@ class AivisCloudTTS:
 
         return audio_data
 
+    def synthesize_and_play_streaming(
+        self,
+        text: str,
+        model_uuid: str,
+        speaker_uuid: Optional[str] = None,
+        style_name: Optional[str] = None,
+        output_format: str = "mp3",
+        speaking_rate: float = 1.0,
+        emotional_intensity: float = 1.0,
+        volume: float = 1.0
+    ) -> int:
+        """
+        テキストから音声を合成し、受信しながらプレイヤーの標準入力に流して再生
+
+        音声データ全体をメモリに溜めずに再生を開始するため、
+        最初の音声が流れるまでの時間がAPIの応答開始時間とほぼ等しくなる。
+
+        Args:
+            text: 合成するテキスト
+            model_uuid: 音声合成モデルのUUID
+            speaker_uuid: 話者のUUID（オプション）
+            style_name: スタイル名（オプション）
+            output_format: 出力形式（wav, mp3, flac, aac, opus）
+            speaking_rate: 話速（0.5-2.0）
+            emotional_intensity: 感情表現の強さ（0.0-2.0）
+            volume: 音量（0.0-2.0）
+
+        Returns:
+            受信した音声データのバイト数
+        """
+        player_command = self._find_stdin_player(output_format)
+        if not player_command:
+            raise Exception("標準入力から再生できるプレイヤー（ffplay または mpg123）が見つかりません")
+
+        payload = {
+            "model_uuid": model_uuid,
+            "use_ssml": True,
+            "text": text,
+            "output_format": output_format,
+            "speaking_rate": speaking_rate,
+            "emotional_intensity": emotional_intensity,
+            "volume": volume
+        }
+
+        if speaker_uuid:
+            payload["speaker_uuid"] = speaker_uuid
+
+        if style_name:
+            payload["style_name"] = style_name
+
+        response = self._post_synthesis(payload)
+
+        # JSON エラーレスポンスはプレイヤー起動前に検出
+        if response.headers.get('Content-Type', '').startswith('application/json'):
+            self._check_json_error(response.content)
+
+        player = subprocess.Popen(
+            player_command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+        # 受信したチャンクをそのままプレイヤーに書き込む
+        total_bytes = 0
+        try:
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                if chunk:
+                    player.stdin.write(chunk)
+                    total_bytes += len(chunk)
+        except BrokenPipeError:
+            # プレイヤーが先に終了した場合（キャンセル等）
+            pass
+        except BaseException:
+            player.terminate()
+            raise
+        finally:
+            try:
+                player.stdin.close()  # EOFを通知
+            except OSError:
+                pass
+
+        try:
+            player.wait()
+        except KeyboardInterrupt:
+            player.terminate()
+            try:
+                player.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                player.kill()
+            raise
+
+        return total_bytes
+
+    def open_stream_player(self, output_format: str = "mp3") -> Optional[subprocess.Popen]:
+        """
+        標準入力から音声を読み続けるプレイヤーを起動
+
+        複数チャンクの音声を同じプロセスに書き込むことで、チャンクごとの
+        一時ファイル作成とプロセス起動を省く。書き込み終了後は呼び出し側で
+        stdinを閉じてwait()すること。
+
+        Args:
+            output_format: 音声形式
+
+        Returns:
+            プレイヤーのプロセス（対応プレイヤーがない場合はNone）
+        """
+        player_command = self._find_stdin_player(output_format)
+        if not player_command:
+            return None
+        return subprocess.Popen(
+            player_command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+    def supports_streaming_playback(self, output_format: str = "mp3") -> bool:
+        """synthesize_and_play_streamingで再生できる環境かどうか"""
+        return self._find_stdin_player(output_format) is not None
+
+    def _check_json_error(self, audio_data: bytes, content_type: str = ""):
+        """APIがJSON形式のエラーを返した場合に例外を発生させる"""
+        # 音声として返された場合は本文を調べない
+        if content_type.startswith('audio/'):
+            return
+        if audio_data.startswith(b'{'):
+            try:
+                error_data = _json_loads(audio_data)  # bytesのままパース（全体のデコードを省く）
+            except ValueError:
+                return  # JSON でない場合は通常の音声データとして処理
+            if isinstance(error_data, dict) and 'status_code' in error_data and 'detail' in error_data:
+                raise Exception(f"API Error: {error_data['status_code']} - {error_data['detail']}")
+
     def _handle_http_error(self, response):
         """HTTPエラーの詳細処理"""
         status_code = response.status_code
@@ -319,6 +574,28 @@ class AivisCloudTTS:
             audio_data: 音声データ
             output_format: 音声形式
         """
+        # 標準入力対応のプレイヤーがあれば一時ファイルを経由せずに再生
+        stdin_player = self._find_stdin_player(output_format)
+        if stdin_player:
+            proc = subprocess.Popen(
+                stdin_player,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            try:
+                self._feed_player_stdin(proc, audio_data)
+                proc.wait()  # 完了を待つ
+            except KeyboardInterrupt:
+                if proc.poll() is None:
+                    proc.terminate()
+                    try:
+                        proc.wait(timeout=2)
+                    except subprocess.TimeoutExpired:
+                        proc.kill()
+                raise
+            return None
+
         # 一時ファイルに音声データを保存
         file_extension = output_format
         if output_format == "opus":
@@ -375,7 +652,21 @@ class AivisCloudTTS:
             
         Returns:
             tuple: (subprocess.Popen, temp_file_path) プロセスオブジェクトと一時ファイルパス
+                   （標準入力で再生した場合、temp_file_pathはNone）
         """
+        # 標準入力対応のプレイヤーがあれば一時ファイルを経由せずに再生
+        stdin_player = self._find_stdin_player(output_format)
+        if stdin_player:
+            proc = subprocess.Popen(
+                stdin_player,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            # パイプへの書き込みは再生の進行に合わせてブロックするため別スレッドで行う
+            threading.Thread(target=self._feed_player_stdin, args=(proc, audio_data), daemon=True).start()
+            return proc, None
+
         # 一時ファイルに音声データを保存
         file_extension = output_format
         if output_format == "opus":
@@ -401,7 +692,6 @@ class AivisCloudTTS:
             elif sys.platform == "win32":
                 # Windowsでは非同期再生が複雑なため、従来の方法にフォールバック
                 import winsound
-                import threading
                 
                 def play_windows_audio():
                     winsound.PlaySound(temp_file_path, winsound.SND_FILENAME)
@@ -442,4 +732,44 @@ class AivisCloudTTS:
                 pass
             raise e
 
-        return proc, temp_file_path
\ No newline at end of file
+        return proc, temp_file_path
+
+    def _find_stdin_player(self, output_format: str):
+        """標準入力から再生できるプレイヤーのコマンドを返す（見つからない場合はNone）"""
+        # Windowsはwinsoundでファイル再生、afplayは標準入力に非対応
+        if sys.platform not in ("darwin", "linux"):
+            return None
+        for command, formats in STDIN_PLAYERS:
+            if (formats is None or output_format in formats) and shutil.which(command[0]):
+                return command
+        return None
+
+    @staticmethod
+    def _remove_file(path: str):
+        """ファイルを削除（存在しない場合は無視）"""
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    @classmethod
+    def _remove_after_exit(cls, proc, path: str):
+        """プロセスの終了を待ってファイルを削除"""
+        try:
+            proc.wait()
+        finally:
+            cls._remove_file(path)
+
+    @staticmethod
+    def _feed_player_stdin(proc, audio_data: bytes):
+        """プレイヤーの標準入力に音声データを書き込んで閉じる"""
+        try:
+            proc.stdin.write(audio_data)
+        except (BrokenPipeError, OSError):
+            # 再生がキャンセルされた場合は書き込みを中断
+            pass
+        finally:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
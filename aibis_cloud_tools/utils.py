@@ -5,64 +5,88 @@
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 
 
-def load_env_file():
-    """プロジェクトルートの.envファイルを読み込む"""
-    # lib/utils.pyから見たプロジェクトルート
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    env_file = project_root / ".env"
-    
-    if env_file.exists():
-        try:
-            with open(env_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        # 値の末尾のコメントを削除（# より前の部分のみ使用）
-                        if '#' in value:
-                            value = value.split('#')[0].strip()
-                        # 環境変数が未設定の場合のみ設定
-                        if key.strip() not in os.environ:
-                            os.environ[key.strip()] = value.strip()
-        except Exception as e:
-            print(f"⚠️  .envファイル読み込みエラー: {e}")
+# Markdownクリーニング用の正規表現（モジュール読み込み時に一度だけコンパイル）
+_MD_HEADER_RE = re.compile(r'^#{1,6}\s*(.+)$', re.MULTILINE)
+_MD_BOLD_ASTERISK_RE = re.compile(r'\*\*(.*?)\*\*')
+_MD_BOLD_UNDERSCORE_RE = re.compile(r'__(.*?)__')
+_MD_ITALIC_ASTERISK_RE = re.compile(r'(?<!\*)\*([^\*\n]+?)\*(?!\*)')
+_MD_ITALIC_UNDERSCORE_RE = re.compile(r'(?<!_)_([^_\n]+?)_(?!_)')
+_MD_CODE_BLOCK_RE = re.compile(r'```[\s\S]*?```')
+_MD_INLINE_CODE_RE = re.compile(r'`([^`\n]*)`')
+_MD_LINK_RE = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+_MD_LIST_RE = re.compile(r'^[\s]*[-\*\+]\s*(.+)$', re.MULTILINE)
+_MD_QUOTE_RE = re.compile(r'^>\s*(.+)$', re.MULTILINE)
+_MULTIPLE_NEWLINES_RE = re.compile(r'\n{3,}')
+
+# プロジェクトルートの.envファイル（aibis_cloud_tools/utils.pyから見たプロジェクトルート）
+ENV_FILE = Path(__file__).parent.parent / ".env"
+
+# テキスト分割用：文末記号（。！？改行）の直後で区切る
+_SENTENCE_END_RE = re.compile(r'(?<=[。！？\n])')
+
+
+def load_env_file(env_file=None):
+    """.envファイルを読み込む（省略時はプロジェクトルートの.envファイル）"""
+    env_file = Path(env_file) if env_file is not None else ENV_FILE
+
+    if not env_file.exists():
+        return
+    
+    try:
+        lines = (line.strip() for line in env_file.read_text(encoding='utf-8').splitlines())
+        for line in lines:
+            if not line or line[0] == '#' or '=' not in line:
+                continue
+            key, value = line.split('=', 1)
+            # 値の末尾のコメントを削除（# より前の部分のみ使用）
+            value = value.split('#', 1)[0]
+            # 環境変数が未設定の場合のみ設定
+            os.environ.setdefault(key.strip(), value.strip())
+    except Exception as e:
+        print(f"⚠️  .envファイル読み込みエラー: {e}")
 
 
 def split_text_smart(text, max_chars=3000):
     """テキストを賢く分割する（文章境界を考慮）"""
+    # 分割不要な短いテキストはキャッシュ参照もせずにそのまま返す
+    if len(text) <= max_chars:
+        return [text] if text else []
+    # 同じテキストの再分割を避けるため結果をキャッシュ（呼び出し側には新しいリストを返す）
+    return list(_split_text_cached(text, max_chars))
+
+
+def _split_text(text, max_chars):
+    """split_text_smartの本体（結果はタプルで返す）"""
     if not text:  # 空文字列チェックを追加
-        return []
+        return ()
     if len(text) <= max_chars:
-        return [text]
+        return (text,)
     
     chunks = []
-    current_chunk = ""
-    
-    # 文単位で分割（。！？で終わる文を優先）
-    sentences = []
-    temp_sentence = ""
+    current_parts = []  # 確定前のチャンクを構成する文（確定時に一度だけ連結）
+    current_len = 0
     
-    for char in text:
-        temp_sentence += char
-        if char in '。！？\n':
-            sentences.append(temp_sentence.strip())
-            temp_sentence = ""
+    # 文単位で分割（。！？で終わる文を優先）。走査は正規表現エンジンに任せる
+    pieces = _SENTENCE_END_RE.split(text)
+    rest = pieces.pop()  # 区切り文字で終わっていない末尾（空文字列の場合もある）
+    sentences = [piece.strip() for piece in pieces]
     
     # 残りがあれば追加
-    if temp_sentence.strip():
-        sentences.append(temp_sentence.strip())
+    if rest.strip():
+        sentences.append(rest.strip())
     
     # 文をチャンクに結合
     for sentence in sentences:
         # 文が長すぎる場合は強制分割
         if len(sentence) > max_chars:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-                current_chunk = ""
+            if current_len:
+                chunks.append("".join(current_parts).strip())
+                current_parts = []
+                current_len = 0
             
             # 長すぎる文を強制分割
             while len(sentence) > max_chars:
@@ -70,23 +94,56 @@ def split_text_smart(text, max_chars=3000):
                 sentence = sentence[max_chars:]
             
             if sentence:
-                current_chunk = sentence
+                current_parts = [sentence]
+                current_len = len(sentence)
         
         # 文を追加してもmax_charsを超えない場合
-        elif len(current_chunk + sentence) <= max_chars:
-            current_chunk += sentence
+        elif current_len + len(sentence) <= max_chars:
+            current_parts.append(sentence)
+            current_len += len(sentence)
         
         # 超える場合は現在のチャンクを確定して新しいチャンクを開始
         else:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-            current_chunk = sentence
+            if current_len:
+                chunks.append("".join(current_parts).strip())
+            current_parts = [sentence]
+            current_len = len(sentence)
     
     # 最後のチャンクを追加
-    if current_chunk.strip():
-        chunks.append(current_chunk.strip())
+    last_chunk = "".join(current_parts).strip()
+    if last_chunk:
+        chunks.append(last_chunk)
     
-    return chunks
+    return tuple(chunks)
+
+
+_split_text_cached = lru_cache(maxsize=256)(_split_text)
+
+
+def iter_text_file_chunks(path, max_chars=3000, read_size=64 * 1024):
+    """大きなテキストファイルを少しずつ読み込みながら分割する"""
+    buffer = ""
+    with open(path, 'r', encoding='utf-8') as f:
+        while True:
+            block = f.read(read_size)
+            if not block:
+                break
+            buffer += block
+            if len(buffer) < max_chars:
+                continue
+            
+            # 最後の文境界までを確定させ、残りは次のブロックと結合する
+            cut = max(buffer.rfind(char) for char in '。！？\n') + 1
+            if cut == 0:
+                continue
+            complete, buffer = buffer[:cut].strip(), buffer[cut:]
+            if complete:
+                # 一度しか使わない大きなテキストなのでキャッシュしない
+                yield from _split_text(complete, max_chars)
+    
+    buffer = buffer.strip()
+    if buffer:
+        yield from _split_text(buffer, max_chars)
 
 
 def get_default_model():
@@ -99,32 +156,32 @@ def get_default_model():
 def clean_markdown_for_tts(text):
     """Markdown記法をTTS読み上げ用にクリーニング"""
     # ヘッダー記号の処理（# ## ### など）
-    text = re.sub(r'^#{1,6}\s*(.+)$', r'\1', text, flags=re.MULTILINE)
+    text = _MD_HEADER_RE.sub(r'\1', text)
     
     # 強調記号の削除
-    text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)  # **bold**
-    text = re.sub(r'__(.*?)__', r'\1', text)      # __bold__
-    text = re.sub(r'(?<!\*)\*([^\*\n]+?)\*(?!\*)', r'\1', text)  # *italic* (not part of **)
-    text = re.sub(r'(?<!_)_([^_\n]+?)_(?!_)', r'\1', text)        # _italic_ (not part of __)
+    text = _MD_BOLD_ASTERISK_RE.sub(r'\1', text)     # **bold**
+    text = _MD_BOLD_UNDERSCORE_RE.sub(r'\1', text)   # __bold__
+    text = _MD_ITALIC_ASTERISK_RE.sub(r'\1', text)   # *italic* (not part of **)
+    text = _MD_ITALIC_UNDERSCORE_RE.sub(r'\1', text) # _italic_ (not part of __)
     
     # コードブロックの処理（先に処理）
-    text = re.sub(r'```[\s\S]*?```', 'コード例', text)  # ```code blocks```
-    text = re.sub(r'`([^`\n]*)`', r'\1', text)      # `inline code`
+    text = _MD_CODE_BLOCK_RE.sub('コード例', text)    # ```code blocks```
+    text = _MD_INLINE_CODE_RE.sub(r'\1', text)       # `inline code`
     
     # リンク記法の処理
-    text = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', text)  # [text](url) → text
+    text = _MD_LINK_RE.sub(r'\1', text)  # [text](url) → text
     
     # リスト記号の処理
-    text = re.sub(r'^[\s]*[-\*\+]\s*(.+)$', r'・\1', text, flags=re.MULTILINE)
+    text = _MD_LIST_RE.sub(r'・\1', text)
     
     # 引用記号の削除
-    text = re.sub(r'^>\s*(.+)$', r'\1', text, flags=re.MULTILINE)
+    text = _MD_QUOTE_RE.sub(r'\1', text)
     
     # テーブル区切りの処理
     text = text.replace('|', '、')
     
     # 複数の改行を整理
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _MULTIPLE_NEWLINES_RE.sub('\n\n', text)
     
     # 特殊文字の処理
     text = text.replace('---', '区切り線')
@@ -211,13 +211,12 @@ class ClaudeResponseWatcher(FileSystemEventHandler):
     def handle_claude_response(self, data, file_path):
         """Claudeの応答が検出されたときの処理"""
         try:
-            # 📝 content[0]['text'] の存在をチェック
-            if not self._has_valid_text_content(data):
+            # 📝 content[0]['text'] を一度の参照で取得（存在しない場合はスキップ）
+            content = self._extract_text_content(data)
+            if content is None:
                 print(f"⏭️  content[0]['text']が存在しないため、スキップします")
                 return
             
-            # 安全にcontentを取得
-            content = data['message']['content'][0]['text']
             timestamp = data.get('timestamp', 'N/A')
             session_id = data.get('sessionId', 'N/A')
             
@@ -233,31 +232,14 @@ class ClaudeResponseWatcher(FileSystemEventHandler):
         except Exception as e:
             print(f"❌ Claude応答処理エラー: {e}")
     
-    def _has_valid_text_content(self, data):
-        """content[0]['text']が存在するかチェック"""
+    @staticmethod
+    def _extract_text_content(data):
+        """content[0]['text']を取得（存在しない場合はNone）"""
         try:
-            # messageキーの存在確認
-            if 'message' not in data:
-                return False
-            
-            # contentキーの存在確認
-            if 'content' not in data['message']:
-                return False
-            
-            # contentがリストで、最初の要素が存在するか確認
-            content = data['message']['content']
-            if not isinstance(content, list) or len(content) == 0:
-                return False
-            
-            # 最初の要素にtextキーがあるか確認
-            first_item = content[0]
-            if not isinstance(first_item, dict) or 'text' not in first_item:
-                return False
-            
-            return True
-            
-        except Exception:
-            return False
+            text = data['message']['content'][0]['text']
+        except (KeyError, IndexError, TypeError):
+            return None
+        return text if isinstance(text, str) else None
     
     def handle_claude_response_tts(self, content, timestamp):
         """Claude応答の音声読み上げ処理"""
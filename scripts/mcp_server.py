@@ -4,15 +4,14 @@ Aivis Cloud TTS MCP Server using official MCP framework
 """
 
 import asyncio
+import json
 import os
 import signal
-import subprocess
-import tempfile
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Any
 
-import requests
 from mcp.server.lowlevel import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
 import mcp.server.stdio
@@ -22,17 +21,145 @@ import mcp.types as types
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from aibis_cloud_tools import AivisCloudTTS, get_default_model, split_text_smart
+from aibis_cloud_tools import AivisCloudTTS, AudioCache, synthesis_key, get_default_model, split_text_smart
+
+try:
+    import orjson
+except ImportError:  # optional dependency (fast extra)
+    orjson = None
 
 
 # Initialize TTS client
+@lru_cache(maxsize=1)
+def _create_tts_client(api_key: str) -> AivisCloudTTS:
+    """Create TTS client instance (cached per API key to reuse its HTTP session)"""
+    return AivisCloudTTS(api_key)
+
+
 def get_tts_client() -> AivisCloudTTS:
     """Get TTS client instance"""
     api_key = os.getenv("AIVIS_API_KEY", "")
     if not api_key:
         raise ValueError("AIVIS_API_KEY environment variable is required")
-    return AivisCloudTTS(api_key)
+    return _create_tts_client(api_key)
+
+
+@lru_cache(maxsize=1)
+def _create_audio_cache() -> AudioCache:
+    """Create synthesized audio cache instance (cached to scan the cache directory only once)"""
+    return AudioCache()
+
+
+def get_audio_cache() -> Optional[AudioCache]:
+    """Get synthesized audio cache instance, or None if disabled with AIVIS_AUDIO_CACHE=0"""
+    if os.getenv("AIVIS_AUDIO_CACHE", "1") == "0":
+        return None
+    return _create_audio_cache()
+
+
+def play_chunk(tts_client: AivisCloudTTS, audio_data: bytes, chunk_idx: int, chunks_count: int) -> dict:
+    """Play a synthesized chunk and wait for the playback to finish"""
+    try:
+        proc, temp_file = tts_client.play_audio_async(audio_data, "mp3")
+        try:
+            proc.wait()  # プロセス完了を待機
+            return {"status": "completed", "message": f"Chunk {chunk_idx}/{chunks_count} playback completed"}
+        except Exception as wait_error:
+            return {
+                "status": "error", 
+                "message": f"Chunk {chunk_idx}/{chunks_count} playback wait failed: {str(wait_error)}",
+                "audio_size": len(audio_data)
+            }
+        finally:
+            # 一時ファイルのクリーンアップ
+            if temp_file and os.path.exists(temp_file):
+                try:
+                    os.unlink(temp_file)
+                except OSError:
+                    pass
+    except Exception as e:
+        return {
+            "status": "error", 
+            "message": f"Chunk {chunk_idx}/{chunks_count} playback failed: {str(e)}",
+            "audio_size": len(audio_data)
+        }
+
+
+def format_tool_result(result: dict) -> list[types.TextContent]:
+    """Serialize a tool result as compact JSON text content (using orjson when installed)"""
+    if orjson:
+        text = orjson.dumps(result).decode("utf-8")
+    else:
+        text = json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+    return [types.TextContent(type="text", text=text)]
+
+
+def make_chunk_cache_key(segment: dict, chunk_text: str) -> str:
+    """Build the audio cache key for a chunk of a speech segment"""
+    model_uuid = segment["model_uuid"] or get_default_model()
+    return synthesis_key(
+        chunk_text, model_uuid,
+        emotional_intensity=segment["emotional_intensity"],
+        volume=segment["volume"]
+    )
+
+
+def lookup_cached_chunks(audio_cache: AudioCache, chunk_plans: list) -> Optional[list]:
+    """Return cached audio for every chunk, or None if any chunk is missing"""
+    cached_audio = []
+    for _, segment, text_chunks in chunk_plans:
+        segment_audio = []
+        for chunk_text in text_chunks:
+            audio_data = audio_cache.get(make_chunk_cache_key(segment, chunk_text))
+            if audio_data is None:
+                return None
+            segment_audio.append(audio_data)
+        cached_audio.append(segment_audio)
+    return cached_audio
+
+
+async def play_cached_segments(
+    tts_client: AivisCloudTTS, chunk_plans: list, cached_audio: list, include_text: bool
+) -> dict:
+    """Play fully cached segments as a single concatenated MP3 stream"""
+    # MP3はフレーム単位なので単純な連結でそのまま再生できる
+    all_audio = b"".join(audio_data for segment_audio in cached_audio for audio_data in segment_audio)
+    play_result = await asyncio.to_thread(play_chunk, tts_client, all_audio, 1, 1)
+
+    results = []
+    for (i, segment, text_chunks), segment_audio in zip(chunk_plans, cached_audio):
+        chunk_results = []
+        for chunk_idx, (chunk_text, audio_data) in enumerate(zip(text_chunks, segment_audio), 1):
+            # 再生は全チャンクまとめて1回なので、再生結果はチャンクごとではなく全体で返す
+            chunk_result = {"chunk": chunk_idx, "audio_size": len(audio_data)}
+            if include_text:
+                chunk_result["text"] = chunk_text
+            chunk_results.append(chunk_result)
+
+        segment_result = {
+            "segment": i,
+            "text_length": len(segment["text"]),
+            "chunks_count": len(text_chunks),
+            "audio_size": sum(len(audio_data) for audio_data in segment_audio),
+            "chunks": chunk_results
+        }
+        if include_text:
+            segment_result["text"] = segment["text"]
+        results.append(segment_result)
+
+    total_audio_size = len(all_audio)
+    return {
+        "success": True,
+        "message": f"Successfully played {len(results)} cached speech segments totaling {total_audio_size} bytes",
+        "segments_count": len(results),
+        "total_audio_size": total_audio_size,
+        "playback_result": play_result,
+        "segments": results
+    }
+
 
+# 音声合成の同時リクエスト数の上限
+MAX_CONCURRENT_SYNTHESIS = 3
 
 # MCP Server setup
 server = Server("aivis-tts")
@@ -100,6 +227,11 @@ async def handle_list_tools() -> list[types.Tool]:
                             "required": ["text"]
                         },
                         "minItems": 1
+                    },
+                    "include_text": {
+                        "type": "boolean",
+                        "description": "Echo the synthesized texts back in the result (default: false)",
+                        "default": False
                     }
                 },
                 "anyOf": [
@@ -142,10 +274,36 @@ async def handle_call_tool(
             if not speech_segments:
                 raise ValueError("No text provided in any speak parameter")
             
-            # Process each speech segment sequentially
-            results = []
-            total_audio_size = 0
+            # 結果へのテキストのエコーは要求された場合のみ（応答サイズ削減）
+            include_text = bool(arguments.get("include_text", False))
+            
+            # 全セグメントで1つのクライアント（HTTPセッション）を共有
+            tts_client = get_tts_client()
+            # 初回はキャッシュディレクトリを走査するためイベントループ外で取得
+            audio_cache = await asyncio.to_thread(get_audio_cache)
+            synth_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SYNTHESIS)
             
+            def synthesize_chunk(segment, chunk_text):
+                model_uuid = segment["model_uuid"] or get_default_model()
+                
+                def synthesize():
+                    return tts_client.synthesize_speech(
+                        text=chunk_text,
+                        model_uuid=model_uuid,
+                        emotional_intensity=segment["emotional_intensity"],
+                        volume=segment["volume"]
+                    )
+                
+                if audio_cache is None:
+                    return synthesize()
+                # 同じテキスト・パラメータの合成結果はキャッシュから返す
+                return audio_cache.get_or_synthesize(make_chunk_cache_key(segment, chunk_text), synthesize)
+            
+            async def synthesize(segment, chunk_text):
+                async with synth_semaphore:
+                    return await asyncio.to_thread(synthesize_chunk, segment, chunk_text)
+            
+            chunk_plans = []
             for i, segment in enumerate(speech_segments, 1):
                 if not segment["text"]:
                     continue
@@ -154,66 +312,68 @@ async def handle_call_tool(
                 text_chunks = split_text_smart(segment["text"], 3000)
                 
                 if len(text_chunks) > 1:
-                    print(f"📝 セグメント{i}: テキストを{len(text_chunks)}個のチャンクに分割")
-                
-                # 各チャンクを順次処理
-                chunk_results = []
-                segment_audio_size = 0
+                    # 標準出力はMCPのstdioプロトコルで使うため、ログは標準エラーへ
+                    print(f"📝 セグメント{i}: テキストを{len(text_chunks)}個のチャンクに分割", file=sys.stderr)
                 
-                for chunk_idx, chunk_text in enumerate(text_chunks, 1):
-                    # Synthesize and play audio for this chunk using AivisCloudTTS
-                    tts_client = get_tts_client()
-                    audio_data = tts_client.synthesize_speech(
-                        text=chunk_text,
-                        model_uuid=segment["model_uuid"] or get_default_model(),
-                        emotional_intensity=segment["emotional_intensity"],
-                        volume=segment["volume"]
+                chunk_plans.append((i, segment, text_chunks))
+            
+            # 全チャンクがキャッシュ済みなら連結して1回の再生で済ませる
+            if audio_cache is not None and chunk_plans:
+                cached_audio = await asyncio.to_thread(lookup_cached_chunks, audio_cache, chunk_plans)
+                if cached_audio is not None:
+                    return format_tool_result(
+                        await play_cached_segments(tts_client, chunk_plans, cached_audio, include_text)
                     )
+            
+            # 全チャンクの合成を先に投入し、再生は順番通りに行う
+            segment_plans = [
+                (i, segment, text_chunks, [asyncio.create_task(synthesize(segment, chunk_text)) for chunk_text in text_chunks])
+                for i, segment, text_chunks in chunk_plans
+            ]
+            
+            results = []
+            total_audio_size = 0
+            
+            try:
+                for i, segment, text_chunks, synth_tasks in segment_plans:
+                    # 各チャンクを順次再生
+                    chunk_results = []
+                    segment_audio_size = 0
                     
-                    # Play audio using the TTS client (非同期再生)
-                    try:
-                        proc, temp_file = tts_client.play_audio_async(audio_data, "mp3")
-                        try:
-                            proc.wait()  # プロセス完了を待機
-                            play_result = {"status": "completed", "message": f"Chunk {chunk_idx}/{len(text_chunks)} playback completed"}
-                        except Exception as wait_error:
-                            play_result = {
-                                "status": "error", 
-                                "message": f"Chunk {chunk_idx}/{len(text_chunks)} playback wait failed: {str(wait_error)}",
-                                "audio_size": len(audio_data)
-                            }
-                        finally:
-                            # 一時ファイルのクリーンアップ
-                            if temp_file and os.path.exists(temp_file):
-                                try:
-                                    os.unlink(temp_file)
-                                except OSError:
-                                    pass
-                    except Exception as e:
-                        play_result = {
-                            "status": "error", 
-                            "message": f"Chunk {chunk_idx}/{len(text_chunks)} playback failed: {str(e)}",
-                            "audio_size": len(audio_data)
+                    for chunk_idx, (chunk_text, synth_task) in enumerate(zip(text_chunks, synth_tasks), 1):
+                        audio_data = await synth_task
+                        play_result = await asyncio.to_thread(
+                            play_chunk, tts_client, audio_data, chunk_idx, len(text_chunks)
+                        )
+                        
+                        chunk_result = {
+                            "chunk": chunk_idx,
+                            "audio_size": len(audio_data),
+                            "playback_result": play_result
                         }
+                        if include_text:
+                            chunk_result["text"] = chunk_text
+                        chunk_results.append(chunk_result)
+                        segment_audio_size += len(audio_data)
                     
-                    chunk_result = {
-                        "chunk": chunk_idx,
-                        "text": chunk_text,
-                        "audio_size": len(audio_data),
-                        "playback_result": play_result
+                    segment_result = {
+                        "segment": i,
+                        "text_length": len(segment["text"]),
+                        "chunks_count": len(text_chunks),
+                        "audio_size": segment_audio_size,
+                        "chunks": chunk_results
                     }
-                    chunk_results.append(chunk_result)
-                    segment_audio_size += len(audio_data)
-                
-                segment_result = {
-                    "segment": i,
-                    "text": segment["text"],
-                    "chunks_count": len(text_chunks),
-                    "audio_size": segment_audio_size,
-                    "chunks": chunk_results
-                }
-                results.append(segment_result)
-                total_audio_size += segment_audio_size
+                    if include_text:
+                        segment_result["text"] = segment["text"]
+                    results.append(segment_result)
+                    total_audio_size += segment_audio_size
+            finally:
+                # エラー時は未完了の合成をキャンセル
+                all_synth_tasks = [synth_task for *_, synth_tasks in segment_plans for synth_task in synth_tasks]
+                for synth_task in all_synth_tasks:
+                    synth_task.cancel()
+                # キャンセル・失敗したタスクの例外を回収し、未回収の警告を出さない
+                await asyncio.gather(*all_synth_tasks, return_exceptions=True)
             
             final_result = {
                 "success": True,
@@ -223,11 +383,11 @@ async def handle_call_tool(
                 "segments": results
             }
             
-            return [types.TextContent(type="text", text=str(final_result))]
+            return format_tool_result(final_result)
         
         except Exception as e:
             error_result = {"success": False, "error": str(e)}
-            return [types.TextContent(type="text", text=str(error_result))]
+            return format_tool_result(error_result)
     
     else:
         raise ValueError(f"Unknown tool: {name}")
@@ -237,7 +397,8 @@ async def main():
     """Main entry point"""
     # メイン実行時のみシグナル処理を設定
     def graceful_shutdown(signum, frame):
-        print(f"\n🛑 シグナル {signum} を受信、MCP Server正常終了中...")
+        # print中に割り込まれてもバッファ再入エラーにならないよう直接書き込む
+        os.write(sys.stderr.fileno(), f"\n🛑 シグナル {signum} を受信、MCP Server正常終了中...\n".encode("utf-8"))
         sys.exit(0)
     
     signal.signal(signal.SIGINT, graceful_shutdown)   # Ctrl-C
@@ -258,9 +419,19 @@ async def main():
         )
 
 
+def install_event_loop_policy():
+    """Use uvloop as the event loop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
+
 if __name__ == "__main__":
+    install_event_loop_policy()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        print("\n🛑 MCP Server終了")
+        print("\n🛑 MCP Server終了", file=sys.stderr)
         sys.exit(0)
\ No newline at end of file
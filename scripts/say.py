@@ -7,15 +7,69 @@ import argparse
 import os
 import signal
 import sys
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from itertools import tee
 from pathlib import Path
 
 # プロジェクトルートをPythonパスに追加
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-import requests
-from aibis_cloud_tools import AivisCloudTTS, load_env_file, split_text_smart, get_default_model
+from aibis_cloud_tools import (
+    AudioCache, synthesis_key, load_env_file, split_text_smart, iter_text_file_chunks, get_default_model
+)
+
+# これより大きいテキストファイルは読み込みながら分割する
+LARGE_TEXT_FILE_BYTES = 1024 * 1024
+
+# --list-models の結果をキャッシュする秒数
+MODEL_LIST_CACHE_TTL = 60 * 60
+
+
+@contextmanager
+def atomic_save_file(path):
+    """
+    保存先と同じディレクトリの一時ファイルに書き込み、正常終了時のみ保存先を置き換える
+
+    エラー時や音声データが空の場合は一時ファイルを削除し、既存の保存先には触れない
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        if os.path.getsize(temp_path) > 0:
+            # mkstempは0600で作成するため、通常のopen()で作成した場合と同じ権限にする
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_path, 0o666 & ~umask)
+            os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+
+@contextmanager
+def stream_playback(player):
+    """
+    継続再生用プレイヤーの終了を管理する
+
+    正常終了時はEOFを通知して再生完了を待ち、エラー時は再生途中でもプレイヤーを停止する
+    """
+    try:
+        yield player
+    except BaseException:
+        player.terminate()
+        raise
+    finally:
+        try:
+            player.stdin.close()
+        except OSError:
+            pass
+        player.wait()
 
 
 def main():
@@ -25,7 +79,8 @@ def main():
     
     # メイン実行時のみシグナル処理を設定
     def graceful_shutdown(signum, frame):
-        print(f"\n🛑 シグナル {signum} を受信、正常終了中...")
+        # print中に割り込まれてもバッファ再入エラーにならないよう直接書き込む
+        os.write(sys.stderr.fileno(), f"\n🛑 シグナル {signum} を受信、正常終了中...\n".encode("utf-8"))
         sys.exit(0)
     
     signal.signal(signal.SIGINT, graceful_shutdown)   # Ctrl-C
@@ -40,8 +95,9 @@ def main():
     parser.add_argument("--api-key", "-k", help="API キー（環境変数 AIVIS_API_KEY からも取得可能）")
 
     # オプション引数
-    parser.add_argument("--model-uuid", "-m", default=get_default_model(),
-                       help=f"音声合成モデルのUUID（デフォルト: {get_default_model()}）")
+    default_model = get_default_model()
+    parser.add_argument("--model-uuid", "-m", default=default_model,
+                       help=f"音声合成モデルのUUID（デフォルト: {default_model}）")
     parser.add_argument("--speaker-uuid", "-s", help="話者のUUID")
     parser.add_argument("--style-name", "-n", help="スタイル名（例: Happy, Sad）")
     parser.add_argument("--format", "--fmt", default="mp3",
@@ -64,8 +120,13 @@ def main():
     parser.add_argument("--split-pause", type=float, default=0,
                        help="分割間の一時停止秒数（デフォルト: 0秒）")
     parser.add_argument("--list-models", action="store_true", help="利用可能なモデル一覧を表示")
+    parser.add_argument("--no-cache", action="store_true", help="合成済み音声・モデル一覧のキャッシュを使用しない")
+    parser.add_argument("--concurrency", type=int, default=2,
+                       help="先行して並行合成するチャンク数（1-4、デフォルト: 2）")
 
     args = parser.parse_args()
+    if not 1 <= args.concurrency <= 4:
+        parser.error("--concurrency は1から4の範囲で指定してください")
 
     # API キーの取得
     api_key = args.api_key or os.getenv("AIVIS_API_KEY")
@@ -74,30 +135,44 @@ def main():
         print("--api-key オプションで指定するか、環境変数 AIVIS_API_KEY を設定してください")
         sys.exit(1)
 
+    # HTTPクライアント（requests）は引数の検証後に読み込む（--help等を軽くする）
+    import requests
+    from aibis_cloud_tools import AivisCloudTTS
+
     try:
         client = AivisCloudTTS(api_key)
 
         # モデル一覧表示（テキスト不要のため最初にチェック）
         if args.list_models:
             print("利用可能な音声合成モデル:")
-            models = client.list_models(limit=20)
-            for model in models["aivm_models"]:
-                print(f"  UUID: {model['aivm_model_uuid']}")
-                print(f"  名前: {model['name']}")
-                print(f"  説明: {model['description']}")
-                print(f"  話者数: {len(model['speakers'])}")
-                print()
+            # モデル一覧は頻繁に変わらないため1時間キャッシュする
+            models = client.list_models(limit=20, cache_ttl=0 if args.no_cache else MODEL_LIST_CACHE_TTL)
+            # 一覧をまとめて組み立てて一度に出力する
+            sys.stdout.write("".join(
+                f"  UUID: {model['aivm_model_uuid']}\n"
+                f"  名前: {model['name']}\n"
+                f"  説明: {model['description']}\n"
+                f"  話者数: {len(model['speakers'])}\n"
+                "\n"
+                for model in models["aivm_models"]
+            ))
             return
 
         # テキストの取得
+        text_content = None
+        text_chunks = None
         if args.file:
             try:
-                with open(args.file, 'r', encoding='utf-8') as f:
-                    text_content = f.read().strip()
-                if not text_content:
-                    print("エラー: テキストファイルが空です")
-                    sys.exit(1)
-                print(f"テキストファイル '{args.file}' を読み込みました")
+                text_path = Path(args.file)
+                if text_path.stat().st_size > LARGE_TEXT_FILE_BYTES:
+                    # 全体を読み込まず、先頭のチャンクから合成を始める（読み込みは合成と並行して行う）
+                    text_chunks = iter_text_file_chunks(text_path, args.max_chars)
+                else:
+                    text_content = text_path.read_text(encoding='utf-8').strip()
+                    if text_content == "":
+                        print("エラー: テキストファイルが空です")
+                        sys.exit(1)
+                    print(f"テキストファイル '{args.file}' を読み込みました")
             except FileNotFoundError:
                 print(f"エラー: テキストファイル '{args.file}' が見つかりません")
                 sys.exit(1)
@@ -111,46 +186,37 @@ def main():
             parser.print_help()
             sys.exit(1)
         
-        # 長いテキストの分割処理
-        text_chunks = split_text_smart(text_content, args.max_chars)
-        
-        if len(text_chunks) > 1:
-            print(f"📝 テキストを{len(text_chunks)}個のチャンクに分割しました（{args.max_chars}文字単位）")
-            if args.split_pause > 0:
-                print(f"⏸️  分割間隔: {args.split_pause}秒")
-
-        # テキスト内容を表示（デバッグ用）
-        print(f"合成対象テキスト（{len(text_content)}文字）:")
-        print(f"「{text_content[:100]}{'...' if len(text_content) > 100 else ''}」")
+        if text_chunks is None:
+            # 長いテキストの分割処理
+            text_chunks = split_text_smart(text_content, args.max_chars)
+            chunks_label = str(len(text_chunks))
+            
+            if len(text_chunks) > 1:
+                print(f"📝 テキストを{len(text_chunks)}個のチャンクに分割しました（{args.max_chars}文字単位）")
+                if args.split_pause > 0:
+                    print(f"⏸️  分割間隔: {args.split_pause}秒")
+
+            # テキスト内容を表示（デバッグ用）
+            print(f"合成対象テキスト（{len(text_content)}文字）:")
+            print(f"「{text_content[:100]}{'...' if len(text_content) > 100 else ''}」")
+        else:
+            # チャンク数は読み終わるまで分からない
+            chunks_label = "?"
+            print(f"📝 大きなテキストファイル '{args.file}' のため、読み込みながら{args.max_chars}文字単位で分割します")
         
         # 音声合成（チャンク処理）
         print("音声を合成中...")
         
         # チャンクごとに処理
-        total_audio_data = b""
-        for i, chunk_text in enumerate(text_chunks, 1):
-            print(f"🔊 [{i}/{len(text_chunks)}] チャンク処理中... ({len(chunk_text)}文字)")
-            
-            if args.realtime and not args.no_play:
-                # リアルタイムストリーミング再生
-                print(f"🔊 [{i}/{len(text_chunks)}] リアルタイム再生中...")
-                audio_data = client.synthesize_and_stream(
-                    text=chunk_text,
-                    model_uuid=args.model_uuid,
-                    speaker_uuid=args.speaker_uuid,
-                    style_name=args.style_name,
-                    output_format=args.format,
-                    speaking_rate=args.rate,
-                    emotional_intensity=args.intensity,
-                    volume=args.volume,
-                    save_file=None,  # チャンクごとの保存は無効
-                    enable_realtime_play=True,
-                    no_wait=args.no_wait
-                )
-                print(f"✅ リアルタイム再生完了（{len(audio_data)} bytes）")
-            else:
-                # 従来の方式（全データ受信後に再生）
-                audio_data = client.synthesize_speech(
+        saved_bytes = 0
+        use_realtime = args.realtime and not args.no_play
+        
+        # 非リアルタイム時は後続チャンクを先行して並行合成し、再生中にネットワーク待ちを重ねる
+        audio_cache = None if args.no_cache else AudioCache()
+        
+        def synthesize_chunk(chunk_text):
+            def synthesize():
+                return client.synthesize_speech(
                     text=chunk_text,
                     model_uuid=args.model_uuid,
                     speaker_uuid=args.speaker_uuid,
@@ -160,28 +226,142 @@ def main():
                     emotional_intensity=args.intensity,
                     volume=args.volume
                 )
+            
+            if audio_cache is None:
+                return synthesize()
+            # 同じテキスト・パラメータの合成結果はキャッシュから返す
+            cache_key = synthesis_key(
+                chunk_text, args.model_uuid,
+                speaker_uuid=args.speaker_uuid,
+                style_name=args.style_name,
+                output_format=args.format,
+                speaking_rate=args.rate,
+                emotional_intensity=args.intensity,
+                volume=args.volume
+            )
+            return audio_cache.get_or_synthesize(cache_key, synthesize)
+        
+        try:
+            with ExitStack() as stack:
+                synth_pool = stack.enter_context(ThreadPoolExecutor(max_workers=args.concurrency))
+                # 保存先には受信したチャンクを順次書き込む（全体をメモリに保持しない、非リアルタイム時のみ）
+                # 全チャンクの合成に成功した場合のみ保存先を置き換える
+                save_fp = None
+                if args.save_file and not args.realtime:
+                    save_fp = stack.enter_context(atomic_save_file(args.save_file))
+            
+                # MP3は連結してもそのまま再生できるため、一時停止なしなら1つのプレイヤーに全チャンクを流す
+                # （最後に登録するため、エラー時は他の後始末より先に再生を止める）
+                stream_player = None
+                playback_stopped = False  # プレイヤーが途中で終了した場合は残りを再生しない
+                if not args.no_play and not use_realtime and args.format == "mp3" and args.split_pause == 0:
+                    stream_player = client.open_stream_player(args.format)
+                    if stream_player:
+                        stack.enter_context(stream_playback(stream_player))
+            
+                chunk_iter = iter(text_chunks)
+                if not use_realtime:
+                    # 再生用と先行合成用にチャンク列を分ける（先行分のみバッファされる）
+                    chunk_iter, prefetch_iter = tee(chunk_iter)
+                ahead = deque()  # 再生順に並んだ合成中のFuture
+            
+                def fill_ahead():
+                    while len(ahead) < args.concurrency:
+                        chunk_text = next(prefetch_iter, None)
+                        if chunk_text is None:
+                            return
+                        ahead.append(synth_pool.submit(synthesize_chunk, chunk_text))
+            
+                next_chunk = next(chunk_iter, None)
+                if not use_realtime:
+                    fill_ahead()
+            
+                i = 0
+                while next_chunk is not None:
+                    i += 1
+                    chunk_text = next_chunk
+                    next_chunk = next(chunk_iter, None)
+                    print(f"🔊 [{i}/{chunks_label}] チャンク処理中... ({len(chunk_text)}文字)")
+                
+                    if use_realtime and not args.no_wait and client.supports_streaming_playback(args.format):
+                        # 受信しながらプレイヤーの標準入力へ流して再生
+                        print(f"🔊 [{i}/{chunks_label}] リアルタイム再生中...")
+                        received_bytes = client.synthesize_and_play_streaming(
+                            text=chunk_text,
+                            model_uuid=args.model_uuid,
+                            speaker_uuid=args.speaker_uuid,
+                            style_name=args.style_name,
+                            output_format=args.format,
+                            speaking_rate=args.rate,
+                            emotional_intensity=args.intensity,
+                            volume=args.volume
+                        )
+                        print(f"✅ リアルタイム再生完了（{received_bytes} bytes）")
+                    elif use_realtime:
+                        # リアルタイムストリーミング再生
+                        print(f"🔊 [{i}/{chunks_label}] リアルタイム再生中...")
+                        client.synthesize_and_stream(
+                            text=chunk_text,
+                            model_uuid=args.model_uuid,
+                            speaker_uuid=args.speaker_uuid,
+                            style_name=args.style_name,
+                            output_format=args.format,
+                            speaking_rate=args.rate,
+                            emotional_intensity=args.intensity,
+                            volume=args.volume,
+                            save_file=None,  # チャンクごとの保存は無効
+                            enable_realtime_play=True,
+                            no_wait=args.no_wait,
+                            return_audio=False  # 再生のみなので受信データは保持しない
+                        )
+                        print(f"✅ リアルタイム再生完了")
+                    else:
+                        # 従来の方式（全データ受信後に再生）
+                        audio_data = ahead.popleft().result()
+                    
+                        # 後続チャンクの合成を再生前に開始
+                        fill_ahead()
 
-                print(f"チャンク音声データを取得しました（{len(audio_data)} bytes）")
-                total_audio_data += audio_data
+                        print(f"チャンク音声データを取得しました（{len(audio_data)} bytes）")
+                        if save_fp:
+                            save_fp.write(audio_data)
+                            saved_bytes += len(audio_data)
 
-                # 音声再生
-                if not args.no_play:
-                    print(f"🎵 [{i}/{len(text_chunks)}] 音声を再生中...")
-                    temp_file = client.play_audio(audio_data, args.format)
-                    if temp_file:
-                        print(f"音声ファイル: {temp_file}")
-                    print(f"✅ 音声再生完了")
-            
-            # 分割間の一時停止（最後のチャンクでない場合）
-            if i < len(text_chunks) and args.split_pause > 0:
-                print(f"⏸️  {args.split_pause}秒間一時停止...")
-                time.sleep(args.split_pause)
-
-        # 全チャンクの音声データをファイル保存（非リアルタイム時のみ）
-        if args.save_file and not args.realtime and total_audio_data:
-            with open(args.save_file, "wb") as f:
-                f.write(total_audio_data)
-            print(f"💾 音声ファイルを保存しました: {args.save_file} ({len(total_audio_data)} bytes)")
+                        # 音声再生
+                        if playback_stopped:
+                            pass
+                        elif stream_player:
+                            print(f"🎵 [{i}/{chunks_label}] 音声をプレイヤーに送信中...")
+                            try:
+                                stream_player.stdin.write(audio_data)
+                            except BrokenPipeError:
+                                # プレイヤーが終了した場合は残りを再生しない
+                                print("⚠️  プレイヤーが終了したため再生を中止しました")
+                                playback_stopped = True
+                        elif not args.no_play:
+                            print(f"🎵 [{i}/{chunks_label}] 音声を再生中...")
+                            temp_file = client.play_audio(audio_data, args.format)
+                            if temp_file:
+                                print(f"音声ファイル: {temp_file}")
+                            print(f"✅ 音声再生完了")
+                
+                    # 分割間の一時停止（最後のチャンクでない場合）
+                    if next_chunk is not None and args.split_pause > 0:
+                        print(f"⏸️  {args.split_pause}秒間一時停止...")
+                        time.sleep(args.split_pause)
+        except UnicodeDecodeError:
+            # 大きなテキストファイルは読み込みながら分割するため、不正な文字は合成の途中で見つかる
+            if not args.file:
+                raise
+            print(f"エラー: テキストファイル '{args.file}' の文字エンコーディングが不正です")
+            sys.exit(1)
+
+        if stream_player and not playback_stopped:
+            print(f"✅ 音声再生完了")
+
+        # 保存結果の表示（非リアルタイム時のみ）
+        if args.save_file and not args.realtime and saved_bytes:
+            print(f"💾 音声ファイルを保存しました: {args.save_file} ({saved_bytes} bytes)")
 
         print("完了")
 
@@ -0,0 +1,100 @@
+"""
+テスト共通のフィクスチャ
+"""
+
+import pytest
+
+# プロジェクトルートはpyproject.tomlのpythonpathでPythonパスに追加される
+# watchdogを含む監視スクリプトをテスト収集前に読み込んでおく
+import scripts.claude_code_speaker  # noqa: F401
+from aibis_cloud_tools.tts import AivisCloudTTS
+
+
+@pytest.fixture(scope="session")
+def shared_watch_dir(tmp_path_factory):
+    """監視ディレクトリとして渡すだけのテストで共有する空ディレクトリ（書き込むテストはtmp_pathを使う）"""
+    return tmp_path_factory.mktemp("watch")
+
+
+@pytest.fixture(scope="session")
+def tts_client():
+    """クライアントの状態を変更しないテストで共有するAivisCloudTTS（初期化自体のテストでは使わない）"""
+    with AivisCloudTTS("test-key") as client:
+        yield client
+
+
+class FakeSession:
+    """AivisCloudTTSのHTTPセッション（requests.Session）の代わりに使う、呼び出しを記録するスタブ"""
+
+    def __init__(self):
+        self.response = None
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(("get", url, kwargs))
+        return self.response
+
+    def post(self, url, **kwargs):
+        self.calls.append(("post", url, kwargs))
+        return self.response
+
+
+@pytest.fixture
+def api_session(tts_client, monkeypatch):
+    """tts_clientのHTTPセッションをFakeSessionに差し替える（応答はテスト側でresponseに設定する）"""
+    session = FakeSession()
+    monkeypatch.setattr(tts_client, "session", session)
+    return session
+
+
+class FakeStdin:
+    """プレイヤーの標準入力の代わりに書き込まれたデータを記録するスタブ"""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.closed = False
+        self.writes = 0
+        self.broken_after = None  # この回数だけ書き込んだ後はBrokenPipeErrorを送出する
+
+    def write(self, data):
+        if self.broken_after is not None and self.writes >= self.broken_after:
+            raise BrokenPipeError("プレイヤーが終了しました")
+        self.writes += 1
+        self.data += data
+        return len(data)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeProcess:
+    """TTS再生プロセス（subprocess.Popen）の代わりに使う最小限のスタブ"""
+
+    def __init__(self, poll=None, wait_exc=None):
+        self._poll = poll
+        self._wait_exc = wait_exc
+        self.stdin = FakeStdin()
+        self.terminate_called = 0
+        self.kill_called = 0
+        self.wait_timeouts = []
+
+    def poll(self):
+        return self._poll
+
+    def wait(self, timeout=None):
+        self.wait_timeouts.append(timeout)
+        if self._wait_exc is not None:
+            raise self._wait_exc
+        return self._poll
+
+    def terminate(self):
+        self.terminate_called += 1
+
+    def kill(self):
+        self.kill_called += 1
+
+
+@pytest.fixture
+def fake_process():
+    """FakeProcessを作成するファクトリ"""
+    return FakeProcess
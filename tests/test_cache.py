@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+AudioCacheクラスのテスト
+
+Test-Driven Development approach:
+1. Given (条件): テストの前提条件
+2. When (実行): テスト対象の処理
+3. Then (結果): 期待される結果
+"""
+
+import errno
+import os
+
+import pytest
+from unittest.mock import Mock
+
+from aibis_cloud_tools.cache import AudioCache, synthesis_key
+
+
+class TestAudioCacheMakeKey:
+    """make_keyメソッドのテスト群"""
+
+    def test_同じパラメータでは同じキーが生成される(self):
+        """
+        Given: 同一の合成パラメータ
+        When: make_key()を2回実行
+        Then: 同じキーが返される
+        """
+        # Given/When
+        key1 = AudioCache.make_key("こんにちは", "model-uuid", 1.0, 1.0, "mp3")
+        key2 = AudioCache.make_key("こんにちは", "model-uuid", 1.0, 1.0, "mp3")
+
+        # Then
+        assert key1 == key2
+        assert len(key1) == 64  # SHA-256の16進表現
+
+    def test_パラメータが異なればキーも異なる(self):
+        """
+        Given: 音量だけが異なる合成パラメータ
+        When: make_key()を実行
+        Then: 異なるキーが返される
+        """
+        # Given/When
+        key1 = AudioCache.make_key("こんにちは", "model-uuid", 1.0, 1.0, "mp3")
+        key2 = AudioCache.make_key("こんにちは", "model-uuid", 1.0, 0.5, "mp3")
+
+        # Then
+        assert key1 != key2
+
+
+class TestSynthesisKey:
+    """synthesis_key関数のテスト群"""
+
+    def test_省略した引数はデフォルト値を指定した場合と同じキーになる(self):
+        """
+        Given: MCPサーバーのように一部の引数だけを指定した合成リクエストと、say.pyのように全引数を指定した同じリクエスト
+        When: synthesis_key()を実行
+        Then: 同じキーが返される
+        """
+        # Given/When
+        key1 = synthesis_key("こんにちは", "model-uuid", emotional_intensity=1.5, volume=1)
+        key2 = synthesis_key(
+            "こんにちは", "model-uuid",
+            speaker_uuid=None, style_name=None, output_format="mp3",
+            speaking_rate=1.0, emotional_intensity=1.5, volume=1.0
+        )
+
+        # Then
+        assert key1 == key2
+
+    @pytest.mark.parametrize("kwargs", [
+        {"speaker_uuid": "speaker-uuid"},
+        {"style_name": "Happy"},
+        {"output_format": "wav"},
+        {"speaking_rate": 1.2},
+        {"emotional_intensity": 0.5},
+        {"volume": 0.5},
+    ], ids=["speaker", "style", "format", "rate", "intensity", "volume"])
+    def test_合成パラメータが異なればキーも異なる(self, kwargs):
+        """
+        Given: デフォルト値から1つだけパラメータを変えた合成リクエスト
+        When: synthesis_key()を実行
+        Then: デフォルト値のリクエストとは異なるキーが返される
+        """
+        # Given/When
+        key1 = synthesis_key("こんにちは", "model-uuid")
+        key2 = synthesis_key("こんにちは", "model-uuid", **kwargs)
+
+        # Then
+        assert key1 != key2
+
+
+class TestAudioCacheGetOrSynthesize:
+    """get_or_synthesizeメソッドのテスト群"""
+
+    def test_キャッシュミス時は合成して保存される(self, tmp_path):
+        """
+        Given: 空のキャッシュ
+        When: get_or_synthesize()を実行
+        Then: 合成関数が呼び出され結果がディスクに保存される
+        """
+        # Given
+        cache = AudioCache(tmp_path)
+        synthesize = Mock(return_value=b"fake_audio_data")
+
+        # When
+        result = cache.get_or_synthesize("key1", synthesize)
+
+        # Then
+        assert result == b"fake_audio_data"
+        synthesize.assert_called_once()
+        assert (tmp_path / "key1.audio").read_bytes() == b"fake_audio_data"
+
+    def test_キャッシュヒット時は合成されない(self, tmp_path):
+        """
+        Given: 保存済みのキャッシュ（別インスタンスで作成）
+        When: get_or_synthesize()を実行
+        Then: 合成関数は呼び出されずキャッシュの内容が返される
+        """
+        # Given
+        AudioCache(tmp_path).put("key1", b"cached_audio")
+        cache = AudioCache(tmp_path)
+        synthesize = Mock(return_value=b"fresh_audio")
+
+        # When
+        result = cache.get_or_synthesize("key1", synthesize)
+
+        # Then
+        assert result == b"cached_audio"
+        synthesize.assert_not_called()
+
+    def test_合成エラーはキャッシュされない(self, tmp_path):
+        """
+        Given: 例外を発生させる合成関数
+        When: get_or_synthesize()を実行
+        Then: 例外が伝播しキャッシュには何も保存されない
+        """
+        # Given
+        cache = AudioCache(tmp_path)
+        synthesize = Mock(side_effect=Exception("API Error"))
+
+        # When/Then
+        with pytest.raises(Exception, match="API Error"):
+            cache.get_or_synthesize("key1", synthesize)
+
+        assert cache.get("key1") is None
+
+    def test_書き込みに失敗しても一時ファイルは残らない(self, tmp_path, monkeypatch):
+        """
+        Given: 容量不足でファイルの置き換えに失敗する環境
+        When: get_or_synthesize()を実行
+        Then: 合成結果は返されるがキャッシュされず、一時ファイルも残らない
+        """
+        # Given
+        cache = AudioCache(tmp_path)
+
+        def replace(src, dst):
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr(os, "replace", replace)
+
+        # When
+        result = cache.get_or_synthesize("key1", lambda: b"fake_audio_data")
+
+        # Then
+        assert result == b"fake_audio_data"
+        assert cache.get("key1") is None
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestAudioCacheEviction:
+    """LRU削除のテスト群"""
+
+    def test_上限を超えると最も古いエントリが削除される(self, tmp_path):
+        """
+        Given: 上限10バイトのキャッシュに4バイトのエントリが2つ
+        When: 先頭のエントリを参照した後に3つ目を保存
+        Then: 最も参照の古いエントリだけが削除される
+        """
+        # Given
+        cache = AudioCache(tmp_path, max_bytes=10)
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+
+        # When
+        cache.get("a")
+        cache.put("c", b"cccc")
+
+        # Then
+        assert cache.get("a") == b"aaaa"
+        assert cache.get("b") is None
+        assert cache.get("c") == b"cccc"
+        assert not (tmp_path / "b.audio").exists()
@@ -13,7 +13,7 @@ NC='\033[0m' # No Color
 # 設定
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PROJECT_DIR="$(cd "${SCRIPT_DIR}/.." && pwd)"
-MCP_SERVER_CMD="uv run --directory ${PROJECT_DIR} src/run_mcp_server.py"
+MCP_SERVER_CMD="uv run --directory ${PROJECT_DIR} scripts/mcp_server.py"
 API_KEY="${AIVIS_API_KEY:-aivis_u1DFvX2IDbKh6UH6fDdKg5YEDKkZd8RY}"
 
 # ヘルプ表示
@@ -9,72 +9,149 @@ Test-Driven Development approach:
 """
 
 import pytest
+import json
 import os
-from pathlib import Path
+import threading
+import time
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
-import sys
-
-# プロジェクトルートをPythonパスに追加
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
+import scripts.mcp_server as mcp_server
 from scripts.mcp_server import (
+    format_tool_result,
     get_tts_client,
     handle_list_tools,
     handle_call_tool
 )
 
 
+FAKE_AUDIO_DATA = b"fake_audio_data"
+TEMP_FILE_PATH = "/tmp/test.mp3"
+LONG_TEXT = "これは長いテキストです。" * 300  # 約3600文字
+
+
+@pytest.fixture(autouse=True)
+def disable_audio_cache(monkeypatch):
+    """テスト間で合成結果を共有しないよう音声キャッシュを無効化"""
+    monkeypatch.setenv("AIVIS_AUDIO_CACHE", "0")
+
+
+def decode_result(result):
+    """handle_call_toolの結果（TextContentのリスト）からJSONを取り出す"""
+    return json.loads(result[0].text)
+
+
+def make_client(proc, audio=FAKE_AUDIO_DATA):
+    """呼び出しの検証が不要なテスト用の固定応答のTTSクライアントスタブ"""
+    return SimpleNamespace(
+        synthesize_speech=lambda **kwargs: audio,
+        play_audio_async=lambda audio_data, output_format: (proc, TEMP_FILE_PATH),
+    )
+
+
+@pytest.fixture
+def mcp_env(monkeypatch, fake_process):
+    """handle_call_toolの依存をモジュール属性の直接差し替えで置き換え、TTSクライアントのモックを返す"""
+    mock_client = Mock()
+    mock_client.synthesize_speech.return_value = FAKE_AUDIO_DATA
+    mock_client.play_audio_async.return_value = (fake_process(), TEMP_FILE_PATH)
+
+    monkeypatch.setattr(mcp_server, "get_tts_client", lambda: mock_client)
+    monkeypatch.setattr(mcp_server, "get_default_model", lambda: "default-model-uuid")
+    monkeypatch.setattr(mcp_server, "split_text_smart", lambda text, max_length: [text])
+    monkeypatch.setattr(os.path, "exists", lambda path: True)
+    monkeypatch.setattr(os, "unlink", lambda path: None)
+    return mock_client
+
+
 class TestGetTtsClient:
     """get_tts_client関数のテスト群"""
 
-    def test_正常なAPIキーでクライアントが作成される(self):
+    def test_正常なAPIキーでクライアントが作成される(self, monkeypatch):
         """
         Given: 有効なAIVIS_API_KEY環境変数
         When: get_tts_client()を実行
         Then: AivisCloudTTSインスタンスが返される
         """
         # Given
-        with patch.dict(os.environ, {"AIVIS_API_KEY": "test-api-key"}):
-            
-            # When
-            client = get_tts_client()
-            
-            # Then
-            assert client is not None
-            assert client.api_key == "test-api-key"
+        monkeypatch.setenv("AIVIS_API_KEY", "test-api-key")
 
-    def test_APIキーがない場合は例外が発生する(self):
+        # When
+        client = get_tts_client()
+
+        # Then
+        assert client is not None
+        assert client.api_key == "test-api-key"
+
+    @pytest.mark.parametrize("api_key", [None, ""], ids=["missing", "empty"])
+    def test_APIキーがないか空の場合は例外が発生する(self, monkeypatch, api_key):
         """
-        Given: AIVIS_API_KEY環境変数が設定されていない
+        Given: AIVIS_API_KEY環境変数が設定されていない、または空
         When: get_tts_client()を実行
         Then: ValueError例外が発生する
         """
         # Given
-        with patch.dict(os.environ, {}, clear=True):
-            
-            # When/Then
-            with pytest.raises(ValueError, match="AIVIS_API_KEY environment variable is required"):
-                get_tts_client()
+        if api_key is None:
+            monkeypatch.delenv("AIVIS_API_KEY", raising=False)
+        else:
+            monkeypatch.setenv("AIVIS_API_KEY", api_key)
 
-    def test_空のAPIキーの場合は例外が発生する(self):
+        # When/Then
+        with pytest.raises(ValueError, match="AIVIS_API_KEY environment variable is required"):
+            get_tts_client()
+
+    def test_同じAPIキーではクライアントが再利用される(self, monkeypatch):
         """
-        Given: 空のAIVIS_API_KEY環境変数
-        When: get_tts_client()を実行
-        Then: ValueError例外が発生する
+        Given: 同じAIVIS_API_KEY環境変数
+        When: get_tts_client()を2回実行
+        Then: 同一のインスタンス（HTTPセッション）が返される
         """
         # Given
-        with patch.dict(os.environ, {"AIVIS_API_KEY": ""}):
-            
-            # When/Then
-            with pytest.raises(ValueError, match="AIVIS_API_KEY environment variable is required"):
-                get_tts_client()
+        monkeypatch.setenv("AIVIS_API_KEY", "test-api-key")
+
+        # When
+        client1 = get_tts_client()
+        client2 = get_tts_client()
+
+        # Then
+        assert client1 is client2
+        assert client1.session is client2.session
+
+
+class TestGetAudioCache:
+    """get_audio_cache関数のテスト群"""
+
+    @pytest.mark.parametrize("value, enabled", [
+        (None, True),
+        ("1", True),
+        ("0", False),
+    ], ids=["unset", "enabled", "disabled"])
+    def test_AIVIS_AUDIO_CACHEが0の場合のみキャッシュを使わない(self, monkeypatch, tmp_path, value, enabled):
+        """
+        Given: AIVIS_AUDIO_CACHE環境変数が未設定、1、または0
+        When: get_audio_cache()を実行
+        Then: 0の場合のみNoneが返され、それ以外はキャッシュが返される
+        """
+        # Given
+        from aibis_cloud_tools import AudioCache
+
+        audio_cache = AudioCache(cache_dir=tmp_path)
+        monkeypatch.setattr(mcp_server, "_create_audio_cache", lambda: audio_cache)
+        if value is None:
+            monkeypatch.delenv("AIVIS_AUDIO_CACHE")
+        else:
+            monkeypatch.setenv("AIVIS_AUDIO_CACHE", value)
+
+        # When
+        result = mcp_server.get_audio_cache()
+
+        # Then
+        assert result is (audio_cache if enabled else None)
 
 
 class TestHandleListTools:
     """handle_list_tools関数のテスト群"""
 
-    @pytest.mark.asyncio
     async def test_speak_toolが返される(self):
         """
         Given: 特に条件なし
@@ -90,7 +167,6 @@ class TestHandleListTools:
         assert "text" in tools[0].inputSchema["properties"]
         assert "speaks" in tools[0].inputSchema["properties"]
 
-    @pytest.mark.asyncio
     async def test_tool_schemaが適切に定義される(self):
         """
         Given: 特に条件なし
@@ -120,161 +196,231 @@ class TestHandleListTools:
         assert {"required": ["speaks"]} in tool.inputSchema["anyOf"]
 
 
+class TestFormatToolResult:
+    """format_tool_result関数のテスト群"""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_orjsonの有無に関わらず同じコンパクトなJSONが返される(self, use_orjson):
+        """
+        Given: 日本語を含む結果と、orjsonの有無
+        When: format_tool_result()を実行
+        Then: 空白なし・日本語非エスケープの同じJSONテキストが返される
+        """
+        # Given
+        result = {"success": False, "error": "合成に失敗しました", "segments": [1, 2]}
+        orjson = pytest.importorskip("orjson") if use_orjson else None
+
+        with patch('scripts.mcp_server.orjson', orjson):
+            # When
+            content = format_tool_result(result)
+
+        # Then
+        assert len(content) == 1
+        assert content[0].text == '{"success":false,"error":"合成に失敗しました","segments":[1,2]}'
+
+
 class TestHandleCallTool:
     """handle_call_tool関数のテスト群"""
 
-    @pytest.mark.asyncio
-    async def test_単一テキストモードが正常に処理される(self):
+    @pytest.mark.parametrize("arguments, chunks_by_text, expected_segments, expected_calls", [
+        (
+            {"text": "テストテキスト", "model_uuid": "test-model-uuid", "emotional_intensity": 1.5, "volume": 0.8},
+            {},
+            1,
+            [("テストテキスト", "test-model-uuid", 1.5, 0.8)],
+        ),
+        (
+            {"speaks": [{"text": "第1テキスト", "volume": 1.0}, {"text": "第2テキスト", "volume": 0.5}]},
+            {},
+            2,
+            [("第1テキスト", "default-model-uuid", 1.0, 1.0), ("第2テキスト", "default-model-uuid", 1.0, 0.5)],
+        ),
+        (
+            {"text": LONG_TEXT},
+            {LONG_TEXT: [LONG_TEXT[:3000], LONG_TEXT[3000:]]},
+            1,
+            [(LONG_TEXT[:3000], "default-model-uuid", 1.0, 1.0), (LONG_TEXT[3000:], "default-model-uuid", 1.0, 1.0)],
+        ),
+    ], ids=["single", "multi", "long_split"])
+    async def test_テキストが分割され各チャンクが合成される(
+        self, mcp_env, monkeypatch, capsys, arguments, chunks_by_text, expected_segments, expected_calls
+    ):
         """
-        Given: 単一テキストのspeakリクエスト
+        Given: 単一テキスト、複数テキスト、3000文字を超える長いテキストのspeakリクエスト
         When: handle_call_tool()を実行
-        Then: 音声合成と再生が実行され成功結果が返される
+        Then: 各セグメントが3000文字単位で分割され、チャンクごとに合成されて成功結果が返される。
+              標準出力（MCPプロトコル）には何も書かれない
+        """
+        # Given
+        mock_client = mcp_env
+        mock_client.synthesize_speech.side_effect = lambda text, **kwargs: text.encode("utf-8")
+        split_calls = []
+
+        def record_split(text, max_length):
+            split_calls.append((text, max_length))
+            return chunks_by_text.get(text, [text])
+
+        monkeypatch.setattr(mcp_server, "split_text_smart", record_split)
+        segment_texts = [arguments["text"]] if "text" in arguments else [s["text"] for s in arguments["speaks"]]
+
+        # When
+        result = await handle_call_tool("speak", arguments)
+
+        # Then
+        assert len(result) == 1
+        result_data = decode_result(result)
+
+        assert result_data["success"] is True
+        assert result_data["segments_count"] == expected_segments
+        assert result_data["total_audio_size"] == sum(len(text.encode("utf-8")) for text, *_ in expected_calls)
+
+        # セグメントごとに分割され、各チャンクが指定のパラメータで合成されたことを確認
+        assert split_calls == [(text, 3000) for text in segment_texts]
+        synthesized = [
+            (c.kwargs["text"], c.kwargs["model_uuid"], c.kwargs["emotional_intensity"], c.kwargs["volume"])
+            for c in mock_client.synthesize_speech.call_args_list
+        ]
+        assert sorted(synthesized) == sorted(expected_calls)
+        assert capsys.readouterr().out == ""
+
+    async def test_合成完了順に関わらずセグメント順に再生される(self, mcp_env, fake_process):
+        """
+        Given: 先頭セグメントの合成が後続より遅いspeakリクエスト
+        When: handle_call_tool()を実行
+        Then: 合成は並行して行われ、再生はセグメント順に行われる
         """
         # Given
         arguments = {
-            "text": "テストテキスト",
-            "model_uuid": "test-model-uuid",
-            "emotional_intensity": 1.5,
-            "volume": 0.8
+            "speaks": [
+                {"text": "遅いテキスト"},
+                {"text": "速いテキスト"}
+            ]
         }
-        
-        mock_audio_data = b"fake_audio_data"
-        mock_proc = Mock()
-        mock_proc.wait.return_value = None
-        
-        with patch('scripts.mcp_server.get_tts_client') as mock_get_client, \
-             patch('scripts.mcp_server.get_default_model') as mock_get_model, \
-             patch('scripts.mcp_server.split_text_smart') as mock_split, \
-             patch('os.path.exists') as mock_exists, \
-             patch('os.unlink') as mock_unlink:
-            
-            mock_client = Mock()
-            mock_client.synthesize_speech.return_value = mock_audio_data
-            mock_client.play_audio_async.return_value = (mock_proc, "/tmp/test.mp3")
-            mock_get_client.return_value = mock_client
-            mock_get_model.return_value = "default-model-uuid"
-            mock_split.return_value = ["テストテキスト"]  # 単一チャンク
-            mock_exists.return_value = True
-            
-            # When
-            result = await handle_call_tool("speak", arguments)
-            
-            # Then
-            assert len(result) == 1
-            result_text = result[0].text
-            result_data = eval(result_text)  # 簡易的なJSON解析
-            
-            assert result_data["success"] is True
-            assert result_data["segments_count"] == 1
-            assert result_data["total_audio_size"] == len(mock_audio_data)
-            
-            # モックが適切に呼び出されたことを確認
-            mock_client.synthesize_speech.assert_called_once_with(
-                text="テストテキスト",
-                model_uuid="test-model-uuid",
-                emotional_intensity=1.5,
-                volume=0.8
-            )
-
-    @pytest.mark.asyncio
-    async def test_複数テキストモードが正常に処理される(self):
-        """
-        Given: 複数テキストのspeakリクエスト
+
+        def slow_first_synthesis(text, **kwargs):
+            if text == "遅いテキスト":
+                time.sleep(0.2)
+            return text.encode("utf-8")
+
+        played = []
+
+        def record_playback(audio_data, output_format):
+            played.append(audio_data.decode("utf-8"))
+            return (fake_process(), None)
+
+        mock_client = mcp_env
+        mock_client.synthesize_speech.side_effect = slow_first_synthesis
+        mock_client.play_audio_async.side_effect = record_playback
+
+        # When
+        await handle_call_tool("speak", arguments)
+
+        # Then
+        assert played == ["遅いテキスト", "速いテキスト"]
+        assert mock_client.synthesize_speech.call_count == 2
+
+    async def test_合成エラー時は残りの合成を待たずにエラーが返される(self, mcp_env):
+        """
+        Given: 先頭セグメントの合成が失敗し、後続の合成が遅いspeakリクエスト
         When: handle_call_tool()を実行
-        Then: 各セグメントが順次処理され成功結果が返される
+        Then: 後続の合成完了を待たずにエラー結果が返される
         """
         # Given
         arguments = {
             "speaks": [
-                {"text": "第1テキスト", "volume": 1.0},
-                {"text": "第2テキスト", "volume": 0.5}
+                {"text": "失敗するテキスト"},
+                {"text": "遅いテキスト"}
             ]
         }
-        
-        mock_audio_data1 = b"fake_audio_data1"
-        mock_audio_data2 = b"fake_audio_data2"
-        mock_proc = Mock()
-        mock_proc.wait.return_value = None
-        
-        with patch('scripts.mcp_server.get_tts_client') as mock_get_client, \
-             patch('scripts.mcp_server.get_default_model') as mock_get_model, \
-             patch('scripts.mcp_server.split_text_smart') as mock_split, \
-             patch('os.path.exists') as mock_exists, \
-             patch('os.unlink') as mock_unlink:
-            
-            mock_client = Mock()
-            mock_client.synthesize_speech.side_effect = [mock_audio_data1, mock_audio_data2]
-            mock_client.play_audio_async.return_value = (mock_proc, "/tmp/test.mp3")
-            mock_get_client.return_value = mock_client
-            mock_get_model.return_value = "default-model-uuid"
-            mock_split.side_effect = [["第1テキスト"], ["第2テキスト"]]  # 各々単一チャンク
-            mock_exists.return_value = True
-            
-            # When
+
+        # 遅い合成はテスト側で解放するまで完了しない
+        release_slow = threading.Event()
+        slow_finished = threading.Event()
+
+        def failing_synthesis(text, **kwargs):
+            if text == "失敗するテキスト":
+                raise RuntimeError("synthesis failed")
+            release_slow.wait(timeout=5)
+            slow_finished.set()
+            return b"fake_audio_data"
+
+        mock_client = mcp_env
+        mock_client.synthesize_speech.side_effect = failing_synthesis
+
+        # When
+        try:
             result = await handle_call_tool("speak", arguments)
-            
-            # Then
-            assert len(result) == 1
-            result_text = result[0].text
-            result_data = eval(result_text)
-            
-            assert result_data["success"] is True
-            assert result_data["segments_count"] == 2
-            assert result_data["total_audio_size"] == len(mock_audio_data1) + len(mock_audio_data2)
-            
-            # 各セグメントが処理されたことを確認
-            assert mock_client.synthesize_speech.call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_長いテキストが分割処理される(self):
-        """
-        Given: 3000文字を超える長いテキスト
+            returned_while_blocked = not slow_finished.is_set()
+        finally:
+            release_slow.set()
+
+        # Then
+        result_data = decode_result(result)
+        assert result_data["success"] is False
+        assert "synthesis failed" in result_data["error"]
+        assert returned_while_blocked
+        mock_client.play_audio_async.assert_not_called()
+
+    @pytest.mark.parametrize("include_text", [False, True])
+    async def test_include_text指定時のみテキストが結果に含まれる(self, mcp_env, monkeypatch, fake_process, include_text):
+        """
+        Given: include_textを指定したspeakリクエスト
         When: handle_call_tool()を実行
-        Then: テキストが分割され各チャンクが処理される
+        Then: include_textがTrueの場合のみ結果にテキストが含まれる
         """
         # Given
-        long_text = "これは長いテキストです。" * 300  # 約3600文字
-        arguments = {"text": long_text}
-        
-        mock_audio_data = b"fake_audio_data"
-        mock_proc = Mock()
-        mock_proc.wait.return_value = None
-        
-        with patch('scripts.mcp_server.get_tts_client') as mock_get_client, \
-             patch('scripts.mcp_server.get_default_model') as mock_get_model, \
-             patch('scripts.mcp_server.split_text_smart') as mock_split, \
-             patch('os.path.exists') as mock_exists, \
-             patch('os.unlink') as mock_unlink:
-            
-            mock_client = Mock()
-            mock_client.synthesize_speech.return_value = mock_audio_data
-            mock_client.play_audio_async.return_value = (mock_proc, "/tmp/test.mp3")
-            mock_get_client.return_value = mock_client
-            mock_get_model.return_value = "default-model-uuid"
-            
-            # 2つのチャンクに分割される
-            chunk1 = long_text[:3000]
-            chunk2 = long_text[3000:]
-            mock_split.return_value = [chunk1, chunk2]
-            mock_exists.return_value = True
-            
-            # When
-            result = await handle_call_tool("speak", arguments)
-            
-            # Then
-            result_text = result[0].text
-            result_data = eval(result_text)
-            
-            assert result_data["success"] is True
-            
-            # 分割処理が呼び出されたことを確認
-            mock_split.assert_called_once_with(long_text, 3000)
-            
-            # 各チャンクが処理されたことを確認
-            assert mock_client.synthesize_speech.call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_空のテキストはスキップされる(self):
+        arguments = {"text": "テストテキスト", "include_text": include_text}
+        client = make_client(fake_process())
+        monkeypatch.setattr(mcp_server, "get_tts_client", lambda: client)
+
+        # When
+        result = await handle_call_tool("speak", arguments)
+
+        # Then
+        segment = decode_result(result)["segments"][0]
+        assert segment["text_length"] == len("テストテキスト")
+        assert ("text" in segment) is include_text
+        assert ("text" in segment["chunks"][0]) is include_text
+        # 日本語はエスケープせずにそのまま返す
+        assert ("テストテキスト" in result[0].text) is include_text
+
+    async def test_全チャンクがキャッシュ済みなら合成せず1回で再生される(self, mcp_env, monkeypatch, tmp_path):
+        """
+        Given: 全セグメントの音声がキャッシュ済みのspeakリクエスト
+        When: handle_call_tool()を実行
+        Then: 合成は行われず、連結した音声が1回だけ再生され、再生結果は全体で1つだけ返される
+        """
+        # Given
+        from aibis_cloud_tools import AudioCache
+        from scripts.mcp_server import make_chunk_cache_key
+
+        segments = [
+            {"text": "第1テキスト", "model_uuid": "test-model-uuid", "emotional_intensity": 1.0, "volume": 1.0},
+            {"text": "第2テキスト", "model_uuid": "test-model-uuid", "emotional_intensity": 1.0, "volume": 1.0},
+        ]
+        audio_cache = AudioCache(cache_dir=tmp_path)
+        audio_cache.put(make_chunk_cache_key(segments[0], "第1テキスト"), b"audio1")
+        audio_cache.put(make_chunk_cache_key(segments[1], "第2テキスト"), b"audio2")
+        arguments = {"speaks": segments}
+        mock_client = mcp_env
+        monkeypatch.setenv("AIVIS_AUDIO_CACHE", "1")
+        monkeypatch.setattr(mcp_server, "_create_audio_cache", lambda: audio_cache)
+
+        # When
+        result = await handle_call_tool("speak", arguments)
+
+        # Then
+        result_data = decode_result(result)
+        assert result_data["success"] is True
+        assert result_data["segments_count"] == 2
+        assert result_data["total_audio_size"] == len(b"audio1audio2")
+        assert result_data["playback_result"]["status"] == "completed"
+        chunks = [chunk for segment in result_data["segments"] for chunk in segment["chunks"]]
+        assert chunks == [{"chunk": 1, "audio_size": 6}, {"chunk": 1, "audio_size": 6}]
+        mock_client.synthesize_speech.assert_not_called()
+        mock_client.play_audio_async.assert_called_once_with(b"audio1audio2", "mp3")
+
+    async def test_空のテキストはスキップされる(self, mcp_env):
         """
         Given: 空のテキストを含むspeakリクエスト
         When: handle_call_tool()を実行
@@ -287,40 +433,21 @@ class TestHandleCallTool:
                 {"text": "有効なテキスト"}
             ]
         }
-        
-        mock_audio_data = b"fake_audio_data"
-        mock_proc = Mock()
-        mock_proc.wait.return_value = None
-        
-        with patch('scripts.mcp_server.get_tts_client') as mock_get_client, \
-             patch('scripts.mcp_server.get_default_model') as mock_get_model, \
-             patch('scripts.mcp_server.split_text_smart') as mock_split, \
-             patch('os.path.exists') as mock_exists, \
-             patch('os.unlink') as mock_unlink:
-            
-            mock_client = Mock()
-            mock_client.synthesize_speech.return_value = mock_audio_data
-            mock_client.play_audio_async.return_value = (mock_proc, "/tmp/test.mp3")
-            mock_get_client.return_value = mock_client
-            mock_get_model.return_value = "default-model-uuid"
-            mock_split.return_value = ["有効なテキスト"]  # 空のテキストは除外される
-            mock_exists.return_value = True
-            
-            # When
-            result = await handle_call_tool("speak", arguments)
-            
-            # Then
-            result_text = result[0].text
-            result_data = eval(result_text)
-            
-            assert result_data["success"] is True
-            assert result_data["segments_count"] == 1  # 空のセグメントは除外される
-            
-            # 1回だけ音声合成が呼び出される（空のテキストは除外）
-            assert mock_client.synthesize_speech.call_count == 1
-
-    @pytest.mark.asyncio
-    async def test_音声再生エラーが適切に処理される(self):
+        mock_client = mcp_env
+
+        # When
+        result = await handle_call_tool("speak", arguments)
+
+        # Then
+        result_data = decode_result(result)
+
+        assert result_data["success"] is True
+        assert result_data["segments_count"] == 1  # 空のセグメントは除外される
+
+        # 1回だけ音声合成が呼び出される（空のテキストは除外）
+        assert mock_client.synthesize_speech.call_count == 1
+
+    async def test_音声再生エラーが適切に処理される(self, mcp_env, monkeypatch, fake_process):
         """
         Given: 音声再生でエラーが発生する状況
         When: handle_call_tool()を実行
@@ -328,41 +455,23 @@ class TestHandleCallTool:
         """
         # Given
         arguments = {"text": "テストテキスト"}
-        
-        mock_audio_data = b"fake_audio_data"
-        mock_proc = Mock()
-        mock_proc.wait.side_effect = Exception("Playback failed")
-        
-        with patch('scripts.mcp_server.get_tts_client') as mock_get_client, \
-             patch('scripts.mcp_server.get_default_model') as mock_get_model, \
-             patch('scripts.mcp_server.split_text_smart') as mock_split, \
-             patch('os.path.exists') as mock_exists, \
-             patch('os.unlink') as mock_unlink:
-            
-            mock_client = Mock()
-            mock_client.synthesize_speech.return_value = mock_audio_data
-            mock_client.play_audio_async.return_value = (mock_proc, "/tmp/test.mp3")
-            mock_get_client.return_value = mock_client
-            mock_get_model.return_value = "default-model-uuid"
-            mock_split.return_value = ["テストテキスト"]
-            mock_exists.return_value = True
-            
-            # When
-            result = await handle_call_tool("speak", arguments)
-            
-            # Then
-            result_text = result[0].text
-            result_data = eval(result_text)
-            
-            assert result_data["success"] is True  # 全体としては成功
-            segments = result_data["segments"]
-            assert len(segments) == 1
-            
-            chunk_result = segments[0]["chunks"][0]
-            assert chunk_result["playback_result"]["status"] == "error"
-            assert "Playback failed" in chunk_result["playback_result"]["message"]
-
-    @pytest.mark.asyncio
+        client = make_client(fake_process(wait_exc=Exception("Playback failed")))
+        monkeypatch.setattr(mcp_server, "get_tts_client", lambda: client)
+
+        # When
+        result = await handle_call_tool("speak", arguments)
+
+        # Then
+        result_data = decode_result(result)
+
+        assert result_data["success"] is True  # 全体としては成功
+        segments = result_data["segments"]
+        assert len(segments) == 1
+
+        chunk_result = segments[0]["chunks"][0]
+        assert chunk_result["playback_result"]["status"] == "error"
+        assert "Playback failed" in chunk_result["playback_result"]["message"]
+
     async def test_unknown_toolで例外が発生する(self):
         """
         Given: 未知のツール名
@@ -377,7 +486,6 @@ class TestHandleCallTool:
         with pytest.raises(ValueError, match="Unknown tool: unknown_tool"):
             await handle_call_tool(tool_name, arguments)
 
-    @pytest.mark.asyncio
     async def test_テキストなしのリクエストでエラーが発生する(self):
         """
         Given: textもspeaksも含まないリクエスト
@@ -392,14 +500,12 @@ class TestHandleCallTool:
         
         # Then
         assert len(result) == 1
-        result_text = result[0].text
-        result_data = eval(result_text)
+        result_data = decode_result(result)
         
         assert result_data["success"] is False
         assert "No text provided" in result_data["error"]
 
-    @pytest.mark.asyncio
-    async def test_一時ファイルが適切にクリーンアップされる(self):
+    async def test_一時ファイルが適切にクリーンアップされる(self, mcp_env, monkeypatch, fake_process):
         """
         Given: 正常な音声再生処理
         When: handle_call_tool()を実行
@@ -407,33 +513,13 @@ class TestHandleCallTool:
         """
         # Given
         arguments = {"text": "テストテキスト"}
-        temp_file_path = "/tmp/test.mp3"
-        
-        mock_audio_data = b"fake_audio_data"
-        mock_proc = Mock()
-        mock_proc.wait.return_value = None
-        
-        with patch('scripts.mcp_server.get_tts_client') as mock_get_client, \
-             patch('scripts.mcp_server.get_default_model') as mock_get_model, \
-             patch('scripts.mcp_server.split_text_smart') as mock_split, \
-             patch('os.path.exists') as mock_exists, \
-             patch('os.unlink') as mock_unlink:
-            
-            mock_client = Mock()
-            mock_client.synthesize_speech.return_value = mock_audio_data
-            mock_client.play_audio_async.return_value = (mock_proc, temp_file_path)
-            mock_get_client.return_value = mock_client
-            mock_get_model.return_value = "default-model-uuid"
-            mock_split.return_value = ["テストテキスト"]
-            mock_exists.return_value = True
-            
-            # When
-            await handle_call_tool("speak", arguments)
-            
-            # Then
-            mock_unlink.assert_called_once_with(temp_file_path)
+        client = make_client(fake_process())
+        monkeypatch.setattr(mcp_server, "get_tts_client", lambda: client)
+        unlinked = []
+        monkeypatch.setattr(os, "unlink", unlinked.append)
 
+        # When
+        await handle_call_tool("speak", arguments)
 
-if __name__ == "__main__":
-    # テストを実行
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+        # Then
+        assert unlinked == [TEMP_FILE_PATH]
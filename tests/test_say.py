@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+say.py（音声合成・再生CLI）のテスト
+
+Test-Driven Development approach:
+1. Given (条件): テストの前提条件
+2. When (実行): テスト対象の処理
+3. Then (結果): 期待される結果
+"""
+
+import sys
+import threading
+import time
+
+import pytest
+
+import aibis_cloud_tools
+import scripts.say as say
+from aibis_cloud_tools import split_text_smart
+from aibis_cloud_tools.cache import AudioCache
+
+# 1文（8文字）ずつ4チャンクに分割されるテキスト
+TEXT = "一番目の文です。二番目の文です。三番目の文です。四番目の文です。"
+MAX_CHARS = 8
+CHUNKS = split_text_smart(TEXT, MAX_CHARS)
+
+
+class FakeTTSClient:
+    """say.pyから使うAivisCloudTTSの代わりのスタブ（合成結果はテキストのUTF-8バイト列）"""
+
+    def __init__(self, chunks=CHUNKS, player=None, fail_on=None):
+        self.player = player
+        self.fail_on = fail_on
+        self.synthesized = []
+        self.finished = []
+        self.played = []
+        # チャンクごとの合成開始・完了イベントと、合成を終える前に開始・完了を待つ別チャンク
+        self.started = {chunk: threading.Event() for chunk in chunks}
+        self.done = {chunk: threading.Event() for chunk in chunks}
+        self.wait_until_started = {}
+        self.wait_until_finished = {}
+        self.delays = {}
+
+    def synthesize_speech(self, text, **kwargs):
+        self.synthesized.append(text)
+        self.started[text].set()
+        other = self.wait_until_started.get(text)
+        if other is not None:
+            assert self.started[other].wait(timeout=5)
+        other = self.wait_until_finished.get(text)
+        if other is not None:
+            assert self.done[other].wait(timeout=5)
+        time.sleep(self.delays.get(text, 0))
+        if text == self.fail_on:
+            raise RuntimeError("合成に失敗しました")
+        self.finished.append(text)
+        self.done[text].set()
+        return text.encode("utf-8")
+
+    def open_stream_player(self, output_format):
+        return self.player
+
+    def play_audio(self, audio_data, output_format):
+        self.played.append(audio_data.decode("utf-8"))
+        return None
+
+
+@pytest.fixture
+def run_say(monkeypatch):
+    """FakeTTSClientを使ってsay.pyのmain()を指定した引数で実行する関数を返す"""
+    monkeypatch.setattr(say.signal, "signal", lambda *args: None)
+    monkeypatch.setattr(say, "load_env_file", lambda: None)
+    monkeypatch.setenv("AIVIS_API_KEY", "test-key")
+
+    def run(client, *argv):
+        monkeypatch.setattr(aibis_cloud_tools, "AivisCloudTTS", lambda api_key: client, raising=False)
+        monkeypatch.setattr(sys, "argv", ["say.py", *argv])
+        say.main()
+
+    return run
+
+
+class TestSayPrefetch:
+    """先行合成パイプラインのテスト群"""
+
+    def test_並行合成しても再生はチャンク順に行われる(self, run_say):
+        """
+        Given: 先頭チャンクの合成が2番目のチャンクの合成完了まで終わらないクライアント
+        When: --concurrency 3 で実行
+        Then: 合成は並行して行われ、再生はチャンク順になる
+        """
+        # Given
+        assert len(CHUNKS) == 4
+        client = FakeTTSClient()
+        client.wait_until_finished[CHUNKS[0]] = CHUNKS[1]
+
+        # When
+        run_say(client, TEXT, "--max-chars", str(MAX_CHARS), "--format", "wav",
+                "--concurrency", "3", "--no-cache")
+
+        # Then
+        assert client.finished.index(CHUNKS[1]) < client.finished.index(CHUNKS[0])
+        assert client.played == CHUNKS
+
+    def test_合成エラー時は先行合成の完了を待ってから終了する(self, run_say, capsys):
+        """
+        Given: 先頭チャンクの合成が失敗し、2番目のチャンクの合成がまだ実行中のクライアント
+        When: --concurrency 2 で実行
+        Then: 実行中の合成は完了まで待たれ、後続チャンクは合成されずにエラー終了する
+        """
+        # Given
+        client = FakeTTSClient(fail_on=CHUNKS[0])
+        client.wait_until_started[CHUNKS[0]] = CHUNKS[1]
+        client.delays[CHUNKS[1]] = 0.1
+
+        # When
+        with pytest.raises(SystemExit) as exc_info:
+            run_say(client, TEXT, "--max-chars", str(MAX_CHARS), "--format", "wav",
+                    "--concurrency", "2", "--no-cache")
+
+        # Then
+        assert exc_info.value.code == 1
+        assert "エラー: 合成に失敗しました" in capsys.readouterr().out
+        assert client.finished == [CHUNKS[1]]
+        assert sorted(client.synthesized) == sorted(CHUNKS[:2])
+        assert client.played == []
+
+    @pytest.mark.parametrize("concurrency", ["0", "5"], ids=["too_small", "too_large"])
+    def test_concurrencyが範囲外ならエラーになる(self, run_say, capsys, concurrency):
+        """
+        Given: 1-4の範囲外の--concurrency
+        When: main()を実行
+        Then: 引数エラーで終了し、合成は行われない
+        """
+        # Given
+        client = FakeTTSClient()
+
+        # When
+        with pytest.raises(SystemExit) as exc_info:
+            run_say(client, TEXT, "--concurrency", concurrency, "--no-cache")
+
+        # Then
+        assert exc_info.value.code == 2
+        assert "--concurrency は1から4の範囲で指定してください" in capsys.readouterr().err
+        assert client.synthesized == []
+
+    @pytest.mark.parametrize("no_cache, expected_synthesized", [
+        (False, CHUNKS),
+        (True, CHUNKS * 2),
+    ], ids=["cache", "no_cache"])
+    def test_no_cache指定時のみ毎回合成する(self, run_say, monkeypatch, tmp_path,
+                                       no_cache, expected_synthesized):
+        """
+        Given: 一時ディレクトリを使うキャッシュ
+        When: 同じテキストで2回実行
+        Then: キャッシュ有効時は2回目に合成せず、--no-cache指定時は2回とも合成する
+        """
+        # Given
+        class TempAudioCache(AudioCache):
+            def __init__(self):
+                super().__init__(cache_dir=tmp_path)
+
+        monkeypatch.setattr(say, "AudioCache", TempAudioCache)
+        client = FakeTTSClient()
+        argv = [TEXT, "--max-chars", str(MAX_CHARS), "--format", "wav", "--concurrency", "1"]
+        if no_cache:
+            argv.append("--no-cache")
+
+        # When
+        run_say(client, *argv)
+        run_say(client, *argv)
+
+        # Then
+        assert client.synthesized == expected_synthesized
+        assert client.played == CHUNKS * 2
+
+    def test_大きなテキストファイルは読み込みながら分割して再生される(self, run_say, monkeypatch,
+                                                    tmp_path, capsys):
+        """
+        Given: LARGE_TEXT_FILE_BYTESを超えるテキストファイル
+        When: -fで指定して実行
+        Then: チャンク数を「?」と表示し、ファイル全体をチャンク順に再生する
+        """
+        # Given
+        monkeypatch.setattr(say, "LARGE_TEXT_FILE_BYTES", 10)
+        text_file = tmp_path / "large.txt"
+        text_file.write_text(TEXT, encoding="utf-8")
+        client = FakeTTSClient()
+
+        # When
+        run_say(client, "-f", str(text_file), "--max-chars", str(MAX_CHARS), "--format", "wav",
+                "--no-cache")
+
+        # Then
+        output = capsys.readouterr().out
+        assert "読み込みながら8文字単位で分割します" in output
+        assert "を読み込みました" not in output
+        assert "[1/?]" in output
+        assert "".join(client.played) == TEXT
+
+    def test_大きなテキストファイルの途中に不正な文字があればエンコーディングエラーになる(
+            self, run_say, monkeypatch, tmp_path, capsys):
+        """
+        Given: LARGE_TEXT_FILE_BYTESを超え、途中にUTF-8として不正なバイト列を含むテキストファイル
+        When: -fで指定して実行
+        Then: 文字エンコーディングが不正である旨のエラーで終了する
+        """
+        # Given
+        monkeypatch.setattr(say, "LARGE_TEXT_FILE_BYTES", 10)
+        text_file = tmp_path / "large.txt"
+        text_file.write_bytes(TEXT.encode("utf-8") + b"\xff\xfe" + TEXT.encode("utf-8"))
+        client = FakeTTSClient()
+
+        # When
+        with pytest.raises(SystemExit) as exc_info:
+            run_say(client, "-f", str(text_file), "--max-chars", str(MAX_CHARS), "--format", "wav",
+                    "--no-cache")
+
+        # Then
+        assert exc_info.value.code == 1
+        assert f"エラー: テキストファイル '{text_file}' の文字エンコーディングが不正です" in capsys.readouterr().out
+        assert client.played == []
+
+
+class TestSayStreamPlayer:
+    """MP3を1つのプレイヤーで継続再生する処理のテスト群"""
+
+    def test_全チャンクを1つのプレイヤーに順に送信する(self, run_say, fake_process):
+        """
+        Given: 継続再生用プレイヤーを返すクライアント
+        When: MP3で並行合成して実行
+        Then: 全チャンクがチャンク順にプレイヤーの標準入力へ書き込まれ、EOF後に終了を待つ
+        """
+        # Given
+        player = fake_process()
+        client = FakeTTSClient(player=player)
+        client.wait_until_started[CHUNKS[0]] = CHUNKS[1]
+
+        # When
+        run_say(client, TEXT, "--max-chars", str(MAX_CHARS), "--concurrency", "2", "--no-cache")
+
+        # Then
+        assert bytes(player.stdin.data) == TEXT.encode("utf-8")
+        assert player.stdin.closed
+        assert player.wait_timeouts == [None]
+        assert player.terminate_called == 0
+        assert client.played == []
+
+    def test_合成エラー時はプレイヤーを停止する(self, run_say, fake_process):
+        """
+        Given: 3番目のチャンクの合成が失敗するクライアント
+        When: MP3で実行
+        Then: 再生途中のプレイヤーが停止される
+        """
+        # Given
+        player = fake_process()
+        client = FakeTTSClient(player=player, fail_on=CHUNKS[2])
+
+        # When
+        with pytest.raises(SystemExit):
+            run_say(client, TEXT, "--max-chars", str(MAX_CHARS), "--concurrency", "1", "--no-cache")
+
+        # Then
+        assert bytes(player.stdin.data) == "".join(CHUNKS[:2]).encode("utf-8")
+        assert player.terminate_called == 1
+        assert player.stdin.closed
+
+    def test_プレイヤーが途中で終了したら残りのチャンクは再生しない(self, run_say, fake_process, capsys):
+        """
+        Given: 1チャンク目の書き込み後に標準入力がBrokenPipeErrorになるプレイヤー
+        When: MP3で実行
+        Then: 残りのチャンクはプレイヤーにも個別の再生にも渡されず、正常に終了する
+        """
+        # Given
+        player = fake_process()
+        player.stdin.broken_after = 1
+        client = FakeTTSClient(player=player)
+
+        # When
+        run_say(client, TEXT, "--max-chars", str(MAX_CHARS), "--concurrency", "1", "--no-cache")
+
+        # Then
+        output = capsys.readouterr().out
+        assert bytes(player.stdin.data) == CHUNKS[0].encode("utf-8")
+        assert client.played == []
+        assert output.count("プレイヤーが終了したため再生を中止しました") == 1
+        assert "✅ 音声再生完了" not in output
+        assert client.synthesized == CHUNKS
+
+
+class TestSaySaveFile:
+    """--save-file による保存処理のテスト群"""
+
+    def test_全チャンクの音声を順に保存する(self, run_say, tmp_path, capsys):
+        """
+        Given: 保存先のパス
+        When: --no-play --save-file で並行合成して実行
+        Then: 全チャンクの音声がチャンク順に連結されて保存される
+        """
+        # Given
+        save_path = tmp_path / "out.wav"
+        client = FakeTTSClient()
+        client.wait_until_started[CHUNKS[0]] = CHUNKS[1]
+
+        # When
+        run_say(client, TEXT, "--max-chars", str(MAX_CHARS), "--format", "wav",
+                "--concurrency", "2", "--no-play", "--save-file", str(save_path), "--no-cache")
+
+        # Then
+        assert save_path.read_bytes() == TEXT.encode("utf-8")
+        assert f"音声ファイルを保存しました: {save_path}" in capsys.readouterr().out
+        assert list(tmp_path.iterdir()) == [save_path]
+
+    def test_合成エラー時は既存の保存先を変更しない(self, run_say, tmp_path, capsys):
+        """
+        Given: 既存の保存先と、3番目のチャンクの合成が失敗するクライアント
+        When: --no-play --save-file で実行
+        Then: 既存の保存先は元の内容のままで、一時ファイルも残らない
+        """
+        # Given
+        save_path = tmp_path / "out.wav"
+        save_path.write_bytes(b"previous audio")
+        client = FakeTTSClient(fail_on=CHUNKS[2])
+
+        # When
+        with pytest.raises(SystemExit):
+            run_say(client, TEXT, "--max-chars", str(MAX_CHARS), "--format", "wav",
+                    "--no-play", "--save-file", str(save_path), "--no-cache")
+
+        # Then
+        assert save_path.read_bytes() == b"previous audio"
+        assert "音声ファイルを保存しました" not in capsys.readouterr().out
+        assert list(tmp_path.iterdir()) == [save_path]
@@ -9,287 +9,199 @@ Test-Driven Development approach:
 """
 
 import pytest
-import tempfile
 import os
-from pathlib import Path
-import sys
-from unittest.mock import patch
-
-# プロジェクトルートをPythonパスに追加
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+import uuid
 
 from aibis_cloud_tools.utils import (
     split_text_smart,
+    iter_text_file_chunks,
     clean_markdown_for_tts,
     load_env_file,
     get_default_model
 )
 
+SHORT_TEXT = "これは短いテキストです。" * 10  # 約100文字
+LONG_TEXT = "これは長いテキストです。" * 250  # 約3000文字
+
 
 class TestSplitTextSmart:
     """split_text_smart関数のテスト群"""
 
-    def test_短いテキストは分割されない(self):
-        """
-        Given: 100文字の短いテキスト
-        When: split_text_smart()を1000文字制限で実行
-        Then: 1つのチャンクとして返される
+    @pytest.mark.parametrize("text, max_chars, expected_predicate", [
+        # 短いテキストは分割されない
+        (SHORT_TEXT, 1000, lambda result, text, max_chars: result == [text]),
+        # 長いテキストは上限以内に分割され、連結すると元のテキストに戻る
+        (LONG_TEXT, 1000, lambda result, text, max_chars: (
+            len(result) > 1
+            and all(len(chunk) <= max_chars for chunk in result)
+            and "".join(result) == text
+        )),
+        # 改行位置で分割される
+        ("第1段落です。\n\n第2段落です。\n\n第3段落です。", 20, lambda result, text, max_chars: (
+            len(result) >= 2 and all(len(chunk) <= max_chars for chunk in result)
+        )),
+        # 句読点位置で分割される
+        ("これは第一文です。これは第二文です。これは第三文です。", 15, lambda result, text, max_chars: (
+            len(result) >= 2 and all(len(chunk) <= max_chars for chunk in result)
+        )),
+        # 空文字列は空リストを返す
+        ("", 100, lambda result, text, max_chars: result == []),
+        # max_chars=1では各文字が個別のチャンクになる
+        ("あいうえお", 1, lambda result, text, max_chars: result == ["あ", "い", "う", "え", "お"]),
+    ], ids=["short_not_split", "long_split", "split_at_newlines", "split_at_punctuation", "empty", "max_chars_1"])
+    def test_テキストが上限に応じて分割される(self, text, max_chars, expected_predicate):
+        """
+        Given: 長さや区切り（改行・句読点）の異なるテキストと文字数上限
+        When: split_text_smart()を実行
+        Then: 各ケースの期待どおりに分割される
         """
-        # Given
-        short_text = "これは短いテキストです。" * 10  # 約100文字
-        max_chars = 1000
-        
         # When
-        result = split_text_smart(short_text, max_chars)
-        
-        # Then
-        assert len(result) == 1
-        assert result[0] == short_text
+        result = split_text_smart(text, max_chars)
 
-    def test_長いテキストは適切に分割される(self):
-        """
-        Given: 3000文字の長いテキスト
-        When: split_text_smart()を1000文字制限で実行
-        Then: 複数のチャンクに分割される
-        """
-        # Given
-        long_text = "これは長いテキストです。" * 250  # 約3000文字
-        max_chars = 1000
-        
-        # When
-        result = split_text_smart(long_text, max_chars)
-        
         # Then
-        assert len(result) > 1
-        assert all(len(chunk) <= max_chars for chunk in result)
-        assert "".join(result) == long_text  # 元のテキストが完全に復元される
+        assert expected_predicate(result, text, max_chars)
 
-    def test_改行で適切に分割される(self):
-        """
-        Given: 改行を含むテキスト
-        When: split_text_smart()を実行
-        Then: 改行位置で分割される
-        """
-        # Given
-        text_with_newlines = "第1段落です。\n\n第2段落です。\n\n第3段落です。"
-        max_chars = 20
-        
-        # When
-        result = split_text_smart(text_with_newlines, max_chars)
-        
-        # Then
-        assert len(result) >= 2
-        assert all(len(chunk) <= max_chars for chunk in result)
-        
-    def test_句読点で適切に分割される(self):
+    def test_結果を変更してもキャッシュに影響しない(self):
         """
-        Given: 句読点を含む長いテキスト
-        When: split_text_smart()を実行
-        Then: 句読点位置で分割される
+        Given: 一度分割したテキスト
+        When: 返されたリストを変更してから同じテキストを再度分割
+        Then: 2回目は変更前と同じ結果が返される
         """
         # Given
-        text_with_punctuation = "これは第一文です。これは第二文です。これは第三文です。"
-        max_chars = 15
-        
-        # When
-        result = split_text_smart(text_with_punctuation, max_chars)
-        
-        # Then
-        assert len(result) >= 2
-        assert all(len(chunk) <= max_chars for chunk in result)
+        text = "これは第一文です。これは第二文です。"
+        first = split_text_smart(text, 10)
+        expected = list(first)
 
-    def test_空文字列は空リストを返す(self):
-        """
-        Given: 空文字列
-        When: split_text_smart()を実行
-        Then: 空リストが返される
-        """
-        # Given
-        empty_text = ""
-        max_chars = 100
-        
         # When
-        result = split_text_smart(empty_text, max_chars)
-        
+        first.append("追加")
+        second = split_text_smart(text, 10)
+
         # Then
-        assert result == []
+        assert second == expected
 
-    def test_max_chars_1の場合(self):
+
+class TestIterTextFileChunks:
+    """iter_text_file_chunks関数のテスト群"""
+
+    def test_ブロック境界をまたぐ文も分割上限内で読み込まれる(self, tmp_path):
         """
-        Given: 5文字のテキストとmax_chars=1
-        When: split_text_smart()を実行
-        Then: 各文字が個別のチャンクになる
+        Given: 読み込み単位より大きい、句点で区切られたテキストファイル
+        When: iter_text_file_chunks()を小さな読み込み単位で実行
+        Then: 全チャンクが上限以内で、連結すると元のテキストに戻る
         """
         # Given
-        text = "あいうえお"
-        max_chars = 1
-        
+        text = "これは長いテキストです。" * 50
+        text_file = tmp_path / "long.txt"
+        text_file.write_text(text, encoding="utf-8")
+
         # When
-        result = split_text_smart(text, max_chars)
-        
+        result = list(iter_text_file_chunks(text_file, max_chars=30, read_size=7))
+
         # Then
-        assert len(result) == 5
-        assert result == ["あ", "い", "う", "え", "お"]
+        assert len(result) > 1
+        assert all(len(chunk) <= 30 for chunk in result)
+        assert "".join(result) == text
 
 
 class TestCleanMarkdownForTts:
     """clean_markdown_for_tts関数のテスト群"""
 
-    def test_マークダウン記法が削除される(self):
-        """
-        Given: マークダウン記法を含むテキスト
+    @pytest.mark.parametrize("text, expected_predicate", [
+        # マークダウン記法が削除され、本文は残る
+        ("# 見出し\n**太字**と*斜体*と`コード`", lambda result, text: (
+            all(mark not in result for mark in ["#", "**", "*", "`"])
+            and all(word in result for word in ["見出し", "太字", "斜体", "コード"])
+        )),
+        # 空文字列は空文字列を返す
+        ("", lambda result, text: result == ""),
+        # マークダウン記法を含まない通常のテキストはそのまま返される
+        ("これは普通のテキストです。", lambda result, text: result == text),
+    ], ids=["markdown_removed", "empty", "plain_text_unchanged"])
+    def test_読み上げ用にマークダウン記法が取り除かれる(self, text, expected_predicate):
+        """
+        Given: マークダウン記法を含むテキスト、空文字列、通常のテキスト
         When: clean_markdown_for_tts()を実行
-        Then: マークダウン記法が削除される
+        Then: マークダウン記法だけが削除される
         """
-        # Given
-        markdown_text = "# 見出し\n**太字**と*斜体*と`コード`"
-        
         # When
-        result = clean_markdown_for_tts(markdown_text)
-        
-        # Then
-        assert "#" not in result
-        assert "**" not in result
-        assert "*" not in result
-        assert "`" not in result
-        assert "見出し" in result
-        assert "太字" in result
-        assert "斜体" in result
-        assert "コード" in result
-
-    def test_空文字列は空文字列を返す(self):
-        """
-        Given: 空文字列
-        When: clean_markdown_for_tts()を実行
-        Then: 空文字列が返される
-        """
-        # Given
-        empty_text = ""
-        
-        # When
-        result = clean_markdown_for_tts(empty_text)
-        
-        # Then
-        assert result == ""
+        result = clean_markdown_for_tts(text)
 
-    def test_通常のテキストはそのまま返される(self):
-        """
-        Given: マークダウン記法を含まない通常のテキスト
-        When: clean_markdown_for_tts()を実行
-        Then: 元のテキストがそのまま返される
-        """
-        # Given
-        normal_text = "これは普通のテキストです。"
-        
-        # When
-        result = clean_markdown_for_tts(normal_text)
-        
         # Then
-        assert result == normal_text
+        assert expected_predicate(result, text)
 
 
 class TestLoadEnvFile:
     """load_env_file関数のテスト群"""
 
-    def test_env_fileが存在しない場合は何もしない(self):
+    def test_env_fileが存在しない場合は何もしない(self, tmp_path):
         """
         Given: .envファイルが存在しない環境
         When: load_env_file()を実行
-        Then: 例外が発生せず正常に終了する
+        Then: 例外が発生せず、環境変数も変更されない
         """
-        # Given (一時ディレクトリで実行)
-        with tempfile.TemporaryDirectory() as temp_dir:
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(temp_dir)
-                
-                # When
-                load_env_file()  # 例外が発生しないことを確認
-                
-                # Then
-                # 例外が発生しなければOK
-                assert True
-                
-            finally:
-                os.chdir(original_cwd)
-
-    def test_env_fileが存在する場合は環境変数が設定される(self):
+        # Given
+        env_file = tmp_path / ".env"
+        environ_before = dict(os.environ)
+
+        # When
+        load_env_file(env_file)
+
+        # Then
+        assert dict(os.environ) == environ_before
+
+    def test_env_fileが存在する場合は環境変数が設定される(self, tmp_path, monkeypatch):
         """
         Given: TEST_KEY=test_valueを含む.envファイル
         When: load_env_file()を実行
         Then: 環境変数TEST_KEYがtest_valueに設定される
         """
         # Given
-        # 環境変数をクリーンアップしてから開始
-        test_keys = ["TEST_KEY_FOR_TESTING", "ANOTHER_KEY_FOR_TESTING"]
-        original_values = {}
-        for key in test_keys:
-            original_values[key] = os.environ.get(key)
-            if key in os.environ:
-                del os.environ[key]
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            env_file = Path(temp_dir) / ".env"
-            env_file.write_text("TEST_KEY_FOR_TESTING=test_value\nANOTHER_KEY_FOR_TESTING=another_value")
-            
-            try:
-                # When
-                with patch('aibis_cloud_tools.utils.Path') as mock_path_class:
-                    # Path(__file__).parent.parent を一時ディレクトリに設定
-                    from unittest.mock import Mock
-                    mock_path = Mock()
-                    mock_path.parent.parent = Path(temp_dir)
-                    mock_path_class.return_value = mock_path
-                    load_env_file()
-                
-                # Then
-                assert os.environ.get("TEST_KEY_FOR_TESTING") == "test_value"
-                assert os.environ.get("ANOTHER_KEY_FOR_TESTING") == "another_value"
-                
-            finally:
-                # 環境変数を復元
-                for key, original_value in original_values.items():
-                    if key in os.environ:
-                        del os.environ[key]
-                    if original_value is not None:
-                        os.environ[key] = original_value
+        # 環境変数を未設定にしてから開始（setenvで元の状態を記録し、テスト終了時にmonkeypatchが元に戻す）
+        for key in ["TEST_KEY_FOR_TESTING", "ANOTHER_KEY_FOR_TESTING"]:
+            monkeypatch.setenv(key, "")
+            monkeypatch.delenv(key)
+        env_file = tmp_path / ".env"
+        env_file.write_text("TEST_KEY_FOR_TESTING=test_value\nANOTHER_KEY_FOR_TESTING=another_value")
+
+        # When
+        load_env_file(env_file)
+
+        # Then
+        assert os.environ.get("TEST_KEY_FOR_TESTING") == "test_value"
+        assert os.environ.get("ANOTHER_KEY_FOR_TESTING") == "another_value"
+
+
+@pytest.fixture(scope="session")
+def default_model():
+    """get_default_model()の結果（セッション中に一度だけ取得）"""
+    return get_default_model()
 
 
 class TestGetDefaultModel:
     """get_default_model関数のテスト群"""
 
-    def test_デフォルトモデルUUIDが返される(self):
+    def test_デフォルトモデルUUIDが返される(self, default_model):
         """
         Given: 特に条件なし
         When: get_default_model()を実行
         Then: 有効なUUID形式の文字列が返される
         """
         # Given/When
-        result = get_default_model()
-        
+        result = default_model
+
         # Then
         assert isinstance(result, str)
-        assert len(result) > 0
-        # UUID形式の簡単なチェック（ハイフンで区切られた形式）
-        parts = result.split("-")
-        assert len(parts) == 5  # UUID形式: 8-4-4-4-12
+        # UUIDとして解析できない形式ならValueErrorになる
+        assert str(uuid.UUID(result)) == result
 
-    def test_毎回同じ値が返される(self):
+    def test_毎回同じ値が返される(self, default_model):
         """
-        Given: 複数回の関数呼び出し
-        When: get_default_model()を複数回実行
-        Then: 常に同じ値が返される
+        Given: 一度取得したデフォルトモデル
+        When: get_default_model()を再度実行
+        Then: 同じ値が返される
         """
-        # Given/When
-        result1 = get_default_model()
-        result2 = get_default_model()
-        result3 = get_default_model()
-        
-        # Then
-        assert result1 == result2 == result3
-
+        # When
+        result = get_default_model()
 
-if __name__ == "__main__":
-    # テストを実行
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+        # Then
+        assert result == default_model